@@ -0,0 +1,141 @@
+# Generated by Django 5.0 on 2026-10-15 18:16
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportBatch',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('import_type', models.CharField(choices=[('CSV', 'CSV File Import'), ('EXCEL', 'Excel File Import'), ('PDF', 'PDF Text Extraction'), ('MANUAL', 'Manual Data Entry'), ('API', 'API Data Import'), ('BULK', 'Bulk Data Operation')], help_text='Type of import operation', max_length=10)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending Processing'), ('PROCESSING', 'Currently Processing'), ('REVIEW', 'Ready for Review'), ('APPROVED', 'Approved for Import'), ('COMPLETED', 'Successfully Completed'), ('FAILED', 'Failed with Errors'), ('CANCELLED', 'Cancelled by User'), ('PARTIAL', 'Partially Completed')], default='PENDING', help_text='Current processing status', max_length=20)),
+                ('file_name', models.CharField(blank=True, help_text='Original filename of uploaded file', max_length=255, null=True)),
+                ('file_path', models.CharField(blank=True, help_text='Storage path for uploaded file', max_length=500, null=True)),
+                ('file_size', models.BigIntegerField(blank=True, help_text='File size in bytes', null=True)),
+                ('file_hash', models.CharField(blank=True, help_text='SHA256 hash for file integrity verification', max_length=64, null=True)),
+                ('mime_type', models.CharField(blank=True, help_text='MIME type of uploaded file', max_length=100, null=True)),
+                ('total_records', models.IntegerField(default=0, help_text='Total number of records to process')),
+                ('successful_records', models.IntegerField(default=0, help_text='Successfully processed records')),
+                ('failed_records', models.IntegerField(default=0, help_text='Records that failed processing')),
+                ('skipped_records', models.IntegerField(default=0, help_text='Records skipped due to business rules')),
+                ('fields_extracted', models.IntegerField(default=0, help_text='Number of EXTRACT fields populated')),
+                ('fields_determined', models.IntegerField(default=0, help_text='Number of DETERMINE fields calculated')),
+                ('fields_pending_manual', models.IntegerField(default=0, help_text='Number of DEFINE fields awaiting manual entry')),
+                ('shopping_centers_created', models.IntegerField(default=0, help_text='New shopping centers created')),
+                ('shopping_centers_updated', models.IntegerField(default=0, help_text='Existing shopping centers updated')),
+                ('tenants_created', models.IntegerField(default=0, help_text='New tenant records created')),
+                ('tenants_updated', models.IntegerField(default=0, help_text='Existing tenant records updated')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, help_text='When processing actually began', null=True)),
+                ('completed_at', models.DateTimeField(blank=True, help_text='When processing finished (success or failure)', null=True)),
+                ('import_config', models.JSONField(blank=True, default=dict, help_text='Import configuration and parameters')),
+                ('error_log', models.JSONField(blank=True, default=dict, help_text='Detailed error messages and stack traces')),
+                ('processing_notes', models.TextField(blank=True, help_text='Human-readable processing notes and observations')),
+                ('created_by', models.ForeignKey(blank=True, help_text='User who initiated the import', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_import_batches', to=settings.AUTH_USER_MODEL)),
+                ('reviewed_by', models.ForeignKey(blank=True, help_text='User who reviewed the import results', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviewed_import_batches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Import Batch',
+                'verbose_name_plural': 'Import Batches',
+                'db_table': 'import_batches',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DataQualityFlag',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('flag_type', models.CharField(choices=[('MISSING', 'Missing Required Field'), ('INVALID', 'Invalid Format or Value'), ('SUSPICIOUS', 'Suspicious Value'), ('DUPLICATE', 'Potential Duplicate'), ('INCOMPLETE', 'Incomplete Record'), ('INCONSISTENT', 'Data Inconsistency'), ('GEOCODING', 'Geocoding Issue'), ('BUSINESS_RULE', 'Business Rule Violation')], help_text='Type of quality issue', max_length=20)),
+                ('severity', models.IntegerField(choices=[(1, 'Low - Cosmetic Issue'), (2, 'Medium - Data Quality Impact'), (3, 'High - Significant Issue'), (4, 'Critical - Major Problem'), (5, 'Blocker - Must Fix')], default=2, help_text='Issue severity level', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('content_type', models.CharField(choices=[('shopping_center', 'Shopping Center'), ('tenant', 'Tenant'), ('import_record', 'Import Record')], help_text='Type of object this flag applies to', max_length=50)),
+                ('object_id', models.IntegerField(help_text='ID of the flagged object')),
+                ('field_name', models.CharField(blank=True, help_text='Specific field with the issue', max_length=100, null=True)),
+                ('message', models.TextField(help_text='Human-readable description of the issue')),
+                ('current_value', models.CharField(blank=True, help_text='Current field value causing the issue', max_length=500, null=True)),
+                ('suggested_value', models.CharField(blank=True, help_text='Suggested correction or improvement', max_length=500, null=True)),
+                ('context_data', models.JSONField(blank=True, default=dict, help_text='Additional context and debugging information')),
+                ('is_resolved', models.BooleanField(default=False, help_text='Whether this issue has been addressed')),
+                ('resolved_at', models.DateTimeField(blank=True, help_text='When this issue was resolved', null=True)),
+                ('resolution_notes', models.TextField(blank=True, help_text='Notes about how the issue was resolved')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('resolved_by', models.ForeignKey(blank=True, help_text='User who resolved this issue', null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('import_batch', models.ForeignKey(help_text='Import batch that generated this flag', on_delete=django.db.models.deletion.CASCADE, related_name='quality_flags', to='imports.importbatch')),
+            ],
+            options={
+                'verbose_name': 'Data Quality Flag',
+                'verbose_name_plural': 'Data Quality Flags',
+                'db_table': 'data_quality_flags',
+                'ordering': ['-severity', '-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ImportMappingConfig',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(help_text='Descriptive name for this mapping configuration', max_length=100)),
+                ('description', models.TextField(blank=True, help_text='Description of when to use this mapping')),
+                ('import_type', models.CharField(choices=[('CSV', 'CSV File Import'), ('EXCEL', 'Excel File Import'), ('PDF', 'PDF Text Extraction'), ('MANUAL', 'Manual Data Entry'), ('API', 'API Data Import'), ('BULK', 'Bulk Data Operation')], help_text='Type of import this mapping applies to', max_length=10)),
+                ('column_mapping', models.JSONField(default=dict, help_text='Column name to model field mapping')),
+                ('default_values', models.JSONField(blank=True, default=dict, help_text='Default values for unmapped fields')),
+                ('validation_rules', models.JSONField(blank=True, default=dict, help_text='Custom validation rules for this import type')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('last_used_at', models.DateTimeField(blank=True, help_text='When this mapping was last used', null=True)),
+                ('usage_count', models.IntegerField(default=0, help_text='Number of times this mapping has been used')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'import_mapping_configs',
+                'ordering': ['-last_used_at', 'name'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='importbatch',
+            index=models.Index(fields=['status', 'created_at'], name='import_batc_status_83cef5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='importbatch',
+            index=models.Index(fields=['import_type', 'created_at'], name='import_batc_import__1b1047_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='importbatch',
+            index=models.Index(fields=['created_by'], name='import_batc_created_a89e50_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='importbatch',
+            index=models.Index(fields=['file_hash'], name='import_batc_file_ha_20927f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dataqualityflag',
+            index=models.Index(fields=['content_type', 'object_id'], name='data_qualit_content_0d16c9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dataqualityflag',
+            index=models.Index(fields=['is_resolved', 'severity'], name='data_qualit_is_reso_d53f2a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dataqualityflag',
+            index=models.Index(fields=['import_batch', 'flag_type'], name='data_qualit_import__189a6e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dataqualityflag',
+            index=models.Index(fields=['created_at'], name='data_qualit_created_fdbe60_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='importmappingconfig',
+            unique_together={('name', 'import_type')},
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.0 on 2026-10-15 18:21
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('imports', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='dataqualityflag',
+            options={'verbose_name': 'Data Quality Flag', 'verbose_name_plural': 'Data Quality Flags'},
+        ),
+        migrations.AlterModelOptions(
+            name='importbatch',
+            options={'verbose_name': 'Import Batch', 'verbose_name_plural': 'Import Batches'},
+        ),
+        migrations.AddField(
+            model_name='dataqualityflag',
+            name='content_type_fk',
+            field=models.ForeignKey(blank=True, help_text='Content type of the flagged object (derived from content_type)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='contenttypes.contenttype'),
+        ),
+        migrations.AddField(
+            model_name='importbatch',
+            name='file_chunks',
+            field=models.JSONField(blank=True, default=list, help_text='Content-defined chunks of the file: [{offset, length, sha256}]'),
+        ),
+        migrations.AddIndex(
+            model_name='dataqualityflag',
+            index=models.Index(fields=['content_type_fk', 'object_id'], name='data_qualit_content_9372ea_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dataqualityflag',
+            index=models.Index(condition=models.Q(('is_resolved', False)), fields=['severity', 'created_at'], name='dqf_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dataqualityflag',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['context_data'], name='dqf_context_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='importbatch',
+            index=models.Index(condition=models.Q(('status__in', ['PENDING', 'PROCESSING'])), fields=['created_at'], name='ib_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='importbatch',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['error_log'], name='ib_errlog_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='importbatch',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['file_chunks'], name='ib_chunks_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='importmappingconfig',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['column_mapping'], name='imc_mapping_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
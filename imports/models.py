@@ -13,18 +13,136 @@ Key Features:
 - Progressive data enrichment audit trail
 """
 
-from django.db import models
+from django.apps import apps
+from django.db import models, connection, transaction
+from django.db.models import F, Q, JSONField
 from django.contrib.auth.models import User
-from django.contrib.postgres.fields import JSONField
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from django.core.files.storage import default_storage
+from django.core.cache import cache
 import hashlib
+import io
+import json
 import os
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT for every bulk_create in the import pipeline;
+# tune per environment without a code change
+BULK_BATCH_SIZE = int(os.getenv('SHOPWINDOW_BULK_CREATE_BATCH_SIZE', '500'))
+
+
+# Flag content_type labels and the (app_label, model) they refer to.
+# 'import_record' flags point at raw import rows, which have no model.
+FLAG_CONTENT_TYPE_MODELS = {
+    'shopping_center': ('properties', 'shoppingcenter'),
+    'tenant': ('properties', 'tenant'),
+}
+
+
+# Gear table for content-defined chunking: one fixed 64-bit value per byte,
+# derived deterministically so chunk boundaries are stable across processes.
+_GEAR = tuple(
+    int.from_bytes(hashlib.sha256(bytes([value])).digest()[:8], 'big')
+    for value in range(256)
+)
+_GEAR_BITS = 0xFFFFFFFFFFFFFFFF
+
+
+def _find_chunk_cut(data, min_size, avg_size, max_size, mask_s, mask_l):
+    """Return the length of the next chunk at the start of data (FastCDC cut point)."""
+    length = len(data)
+    if length <= min_size:
+        return length
+    end = min(length, max_size)
+    normal = min(end, avg_size)
+
+    # Bytes below min_size can never be a cut point, so skip hashing them
+    fingerprint = 0
+    position = min_size
+    while position < normal:
+        fingerprint = ((fingerprint << 1) + _GEAR[data[position]]) & _GEAR_BITS
+        position += 1
+        if not fingerprint & mask_s:
+            return position
+    while position < end:
+        fingerprint = ((fingerprint << 1) + _GEAR[data[position]]) & _GEAR_BITS
+        position += 1
+        if not fingerprint & mask_l:
+            return position
+    return end
+
+
+def iter_content_chunks(stream, min_size=64_000, avg_size=262_144, max_size=1_048_576):
+    """
+    Split a binary stream into content-defined chunks (Gear hash / FastCDC).
+
+    Boundaries depend on content rather than offsets, so appending rows to a
+    file leaves the hashes of the earlier chunks unchanged.
+
+    Yields:
+        (offset, chunk bytes) tuples
+    """
+    bits = avg_size.bit_length() - 1
+    # Normalized chunking: stricter mask before avg_size, looser after
+    mask_s = ((1 << (bits + 1)) - 1) << (63 - bits)
+    mask_l = ((1 << (bits - 1)) - 1) << (65 - bits)
+
+    buffer = bytearray()
+    offset = 0
+    eof = False
+    while True:
+        while not eof and len(buffer) < max_size:
+            data = stream.read(max_size)
+            if not data:
+                eof = True
+            else:
+                buffer += data
+        if not buffer:
+            return
+
+        cut = _find_chunk_cut(buffer, min_size, avg_size, max_size, mask_s, mask_l)
+        yield offset, bytes(buffer[:cut])
+        del buffer[:cut]
+        offset += cut
+
+
+# UI colors indexed by DataQualityFlag.severity (index 0 = unknown)
+_SEVERITY_COLORS = (
+    '#6c757d',  # Gray - Unknown
+    '#28a745',  # Green - Low
+    '#ffc107',  # Yellow - Medium
+    '#fd7e14',  # Orange - High
+    '#dc3545',  # Red - Critical
+    '#6f42c1',  # Purple - Blocker
+)
+
+
+@lru_cache(maxsize=None)
+def get_flag_model(label):
+    """Return the model class for a flag content_type label, or None."""
+    natural_key = FLAG_CONTENT_TYPE_MODELS.get(label)
+    if natural_key is None:
+        return None
+    return apps.get_model(*natural_key)
+
+
+def get_flag_content_type(label):
+    """Return the ContentType for a flag content_type label, or None."""
+    natural_key = FLAG_CONTENT_TYPE_MODELS.get(label)
+    if natural_key is None:
+        return None
+    # ContentTypeManager caches lookups, so this is a dict hit after the first call
+    return ContentType.objects.get_by_natural_key(*natural_key)
+
 
 # =============================================================================
 # IMPORT BATCH MODEL
@@ -48,6 +166,27 @@ class ImportBatch(models.Model):
     - Error logging for debugging and improvement
     """
     
+    # Buffered add_error() entries are flushed to the database in batches of this size
+    ERROR_FLUSH_THRESHOLD = 500
+    
+    # Seconds get_summary_stats() results are cached
+    SUMMARY_CACHE_TIMEOUT = 60
+    
+    # Processing metrics maintained through increment_counters()/apply_delta()
+    COUNTER_FIELDS = (
+        'total_records',
+        'successful_records',
+        'failed_records',
+        'skipped_records',
+        'fields_extracted',
+        'fields_determined',
+        'fields_pending_manual',
+        'shopping_centers_created',
+        'shopping_centers_updated',
+        'tenants_created',
+        'tenants_updated',
+    )
+    
     # =============================================================================
     # IMPORT TYPE CHOICES
     # =============================================================================
@@ -116,6 +255,11 @@ class ImportBatch(models.Model):
         null=True,
         help_text="SHA256 hash for file integrity verification"
     )
+    file_chunks = JSONField(
+        default=list,
+        blank=True,
+        help_text="Content-defined chunks of the file: [{offset, length, sha256}]"
+    )
     mime_type = models.CharField(
         max_length=100,
         blank=True,
@@ -236,11 +380,98 @@ class ImportBatch(models.Model):
     # MODEL METHODS
     # =============================================================================
     
-    def calculate_file_hash(self, file_content):
-        """Calculate SHA256 hash of file content."""
-        if isinstance(file_content, str):
-            file_content = file_content.encode('utf-8')
-        return hashlib.sha256(file_content).hexdigest()
+    def save(self, *args, **kwargs):
+        """Write errors buffered by add_error() together with the row."""
+        pending_errors = self._drain_pending_errors()
+        if pending_errors:
+            self.error_log.setdefault('errors', []).extend(pending_errors)
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'error_log' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'error_log']
+        super().save(*args, **kwargs)
+    
+    def calculate_file_hash(self, file_obj=None, chunk_size=1024 * 1024):
+        """
+        Calculate SHA256 hash of an uploaded file.
+
+        Streams the file in fixed-size chunks so memory use stays constant
+        regardless of upload size. Accepts a binary file-like object, a
+        pathlib path into default storage, or (for backwards compatibility)
+        raw bytes/str content. With no argument, hashes the stored file at
+        self.file_path.
+        """
+        if file_obj is None or isinstance(file_obj, os.PathLike):
+            storage_path = os.fspath(file_obj) if file_obj is not None else self.file_path
+            with default_storage.open(storage_path, 'rb') as stored_file:
+                return self.calculate_file_hash(stored_file, chunk_size=chunk_size)
+
+        # Legacy callers pass the whole file content in memory
+        if isinstance(file_obj, str):
+            file_obj = file_obj.encode('utf-8')
+        if isinstance(file_obj, (bytes, bytearray, memoryview)):
+            return hashlib.sha256(memoryview(file_obj)).hexdigest()
+
+        # Python 3.11+: OpenSSL-backed digest reading into a reusable buffer
+        if hasattr(hashlib, 'file_digest') and hasattr(file_obj, 'readinto'):
+            return hashlib.file_digest(file_obj, 'sha256').hexdigest()
+
+        file_hash = hashlib.sha256()
+        for chunk in iter(lambda: file_obj.read(chunk_size), b''):
+            file_hash.update(chunk)
+        return file_hash.hexdigest()
+    
+    def calculate_file_chunks(self, file_obj=None):
+        """
+        Split a file into content-defined chunks and hash each one.
+
+        Accepts the same inputs as calculate_file_hash(). The result is meant
+        for self.file_chunks, so re-uploads of a mostly-similar file (e.g. a
+        new month appended) can be matched chunk by chunk.
+
+        Returns:
+            List of {offset, length, sha256} dicts
+        """
+        if file_obj is None or isinstance(file_obj, os.PathLike):
+            storage_path = os.fspath(file_obj) if file_obj is not None else self.file_path
+            with default_storage.open(storage_path, 'rb') as stored_file:
+                return self.calculate_file_chunks(stored_file)
+
+        if isinstance(file_obj, str):
+            file_obj = file_obj.encode('utf-8')
+        if isinstance(file_obj, (bytes, bytearray, memoryview)):
+            file_obj = io.BytesIO(file_obj)
+
+        return [
+            {
+                'offset': offset,
+                'length': len(chunk),
+                'sha256': hashlib.sha256(chunk).hexdigest(),
+            }
+            for offset, chunk in iter_content_chunks(file_obj)
+        ]
+    
+    def get_ingested_chunks(self):
+        """
+        Return the file_chunks entries already ingested by an earlier batch.
+
+        Their byte ranges can be skipped on re-import. Uses one JSONB
+        containment query (GIN-indexed) for all chunks.
+        """
+        chunk_hashes = {chunk['sha256'] for chunk in self.file_chunks}
+        if not chunk_hashes:
+            return []
+
+        seen = set()
+        matching = (
+            ImportBatch.objects.with_chunks(chunk_hashes)
+            .filter(status__in=['COMPLETED', 'PARTIAL'])
+            .exclude(pk=self.pk)
+            .values_list('file_chunks', flat=True)
+        )
+        for file_chunks in matching:
+            seen.update(chunk['sha256'] for chunk in file_chunks)
+
+        return [chunk for chunk in self.file_chunks if chunk['sha256'] in seen]
     
     def get_success_rate(self):
         """Calculate processing success rate as percentage."""
@@ -268,7 +499,20 @@ class ImportBatch(models.Model):
         self.save()
     
     def mark_completed(self, success=True):
-        """Mark import as completed with success/failure status."""
+        """
+        Mark import as completed with success/failure status.
+        
+        Buffered counters are flushed first, then the whole row is saved so
+        other in-memory edits (processing_notes, error_log, counters) are
+        kept; save() writes buffered errors. The dashboard caches are
+        invalidated once the surrounding transaction commits, so other
+        requests can't re-cache the pre-completion numbers in between.
+        """
+        self.flush_counters()
+        # Counters incremented in the database - read them back so the
+        # status check sees them; values set on the instance are kept
+        self._refresh_delta_counters()
+        
         self.completed_at = timezone.now()
         
         if success:
@@ -280,12 +524,113 @@ class ImportBatch(models.Model):
             self.status = 'FAILED'
         
         self.save()
+        
+        # Finished batches change the dashboard numbers
+        transaction.on_commit(self.invalidate_summary_cache)
+        transaction.on_commit(invalidate_import_statistics)
+    
+    @contextmanager
+    def run_ingestion(self):
+        """
+        Run an import in one transaction with a savepoint per chunk.
+        
+        One commit for the whole import instead of one per statement; a chunk
+        that fails is rolled back to its savepoint and logged, and the rest
+        of the import carries on:
+        
+            with batch.run_ingestion() as ingest_chunk:
+                for number, rows in enumerate(chunks):
+                    with ingest_chunk(number):
+                        ...
+        """
+        with transaction.atomic():
+            yield self._ingest_chunk
+            self.flush_counters()
+            self.flush_errors()
+    
+    @contextmanager
+    def _ingest_chunk(self, chunk_id=None):
+        """Savepoint for one chunk of run_ingestion(); failures are logged, not raised."""
+        pending_counters = dict(self.__dict__.get('_pending_counters', {}))
+        stored_error_count = len(self.error_log.get('errors', []))
+        try:
+            with transaction.atomic():
+                yield
+                self.flush_counters()
+        except Exception as e:
+            # Counts buffered by the rolled-back chunk never happened; those
+            # buffered before it started still did
+            self.__dict__['_pending_counters'] = pending_counters
+            # Errors flushed inside the savepoint were rolled back with it;
+            # buffer them again so they are written later
+            stored_errors = self.error_log.get('errors', [])
+            rolled_back_errors = stored_errors[stored_error_count:]
+            if rolled_back_errors:
+                del stored_errors[stored_error_count:]
+                self.__dict__['_pending_errors'] = rolled_back_errors + self._drain_pending_errors()
+            logger.warning(f"Import batch {self.pk} chunk {chunk_id} rolled back: {e}")
+            self.add_error('CHUNK_FAILED', str(e), {'chunk': chunk_id})
+    
+    def increment_counters(self, **counters):
+        """
+        Buffer processing metric increments in memory.
+        
+        Use this from per-record import loops instead of
+        `batch.successful_records += 1; batch.save()`; the totals are written
+        by flush_counters() once per chunk and on mark_completed().
+        """
+        pending_counters = self.__dict__.setdefault('_pending_counters', {})
+        for field_name, delta in counters.items():
+            if field_name not in self.COUNTER_FIELDS:
+                raise ValueError(f"Unknown import counter: {field_name}")
+            pending_counters[field_name] = pending_counters.get(field_name, 0) + delta
+    
+    def flush_counters(self):
+        """Write buffered counter increments with a single UPDATE."""
+        pending_counters = self.__dict__.pop('_pending_counters', {})
+        if pending_counters:
+            self.apply_delta(**pending_counters)
+    
+    def apply_delta(self, **counters):
+        """
+        Add deltas to processing metrics with one F()-expression UPDATE.
+        
+        The increment happens in the database, so there is no read-modify-write
+        race and no full-row save. Unsaved batches are updated in memory.
+        """
+        for field_name in counters:
+            if field_name not in self.COUNTER_FIELDS:
+                raise ValueError(f"Unknown import counter: {field_name}")
+        
+        if not counters:
+            return
+        
+        if self.pk is None:
+            for field_name, delta in counters.items():
+                setattr(self, field_name, getattr(self, field_name) + delta)
+            return
+        
+        ImportBatch.objects.filter(pk=self.pk).update(**{
+            field_name: F(field_name) + delta
+            for field_name, delta in counters.items()
+        })
+        # The instance's values for these are now behind the database
+        self.__dict__.setdefault('_delta_counters', set()).update(counters)
+    
+    def _refresh_delta_counters(self):
+        """Reload only the counters apply_delta() changed in the database."""
+        delta_counters = self.__dict__.pop('_delta_counters', set())
+        if delta_counters and self.pk is not None:
+            self.refresh_from_db(fields=sorted(delta_counters))
     
     def add_error(self, error_type, message, details=None):
-        """Add error to error log."""
-        if 'errors' not in self.error_log:
-            self.error_log['errors'] = []
+        """
+        Add error to error log.
         
+        Errors are buffered in memory and appended to the stored log in
+        batches of ERROR_FLUSH_THRESHOLD, on save() and on mark_completed(),
+        so a failing import doesn't rewrite the whole row once per error.
+        """
         error_entry = {
             'timestamp': timezone.now().isoformat(),
             'type': error_type,
@@ -293,11 +638,61 @@ class ImportBatch(models.Model):
             'details': details or {}
         }
         
-        self.error_log['errors'].append(error_entry)
-        self.save()
+        pending_errors = self.__dict__.setdefault('_pending_errors', [])
+        pending_errors.append(error_entry)
+        
+        if len(pending_errors) >= self.ERROR_FLUSH_THRESHOLD:
+            self.flush_errors()
+    
+    def flush_errors(self):
+        """Append buffered errors to error_log with a single JSONB UPDATE."""
+        pending_errors = self._drain_pending_errors()
+        if not pending_errors:
+            return
+        
+        self.error_log.setdefault('errors', []).extend(pending_errors)
+        
+        if self.pk is None:
+            # Not stored yet - the errors go out with the first save()
+            return
+        
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE import_batches
+                SET error_log = jsonb_set(
+                    COALESCE(error_log, '{}'::jsonb),
+                    '{errors}',
+                    COALESCE(error_log->'errors', '[]'::jsonb) || %s::jsonb
+                )
+                WHERE id = %s
+                """,
+                [json.dumps(pending_errors), self.pk]
+            )
+    
+    def _drain_pending_errors(self):
+        """Return and clear errors buffered by add_error()."""
+        return self.__dict__.pop('_pending_errors', [])
     
     def get_summary_stats(self):
-        """Get summary statistics for dashboard display."""
+        """
+        Get summary statistics for dashboard display.
+        
+        Cached for SUMMARY_CACHE_TIMEOUT seconds; mark_completed() clears it.
+        """
+        if self.pk is None:
+            return self._calculate_summary_stats()
+        return cache.get_or_set(
+            self._summary_cache_key(),
+            self._calculate_summary_stats,
+            self.SUMMARY_CACHE_TIMEOUT
+        )
+    
+    def _calculate_summary_stats(self):
+        """Build summary statistics from the current counters."""
+        # Counters are incremented in the database by apply_delta()
+        self._refresh_delta_counters()
+        
         return {
             'total_records': self.total_records,
             'success_rate': self.get_success_rate(),
@@ -312,13 +707,19 @@ class ImportBatch(models.Model):
             }
         }
     
+    def invalidate_summary_cache(self):
+        """Drop the cached get_summary_stats() result."""
+        cache.delete(self._summary_cache_key())
+    
+    def _summary_cache_key(self):
+        return f"import_batch_summary_{self.pk}"
+    
     # =============================================================================
     # MODEL CONFIGURATION
     # =============================================================================
     
     class Meta:
         db_table = 'import_batches'
-        ordering = ['-created_at']
         verbose_name = 'Import Batch'
         verbose_name_plural = 'Import Batches'
         
@@ -327,6 +728,16 @@ class ImportBatch(models.Model):
             models.Index(fields=['import_type', 'created_at']),
             models.Index(fields=['created_by']),
             models.Index(fields=['file_hash']),
+            # Partial index for pending()/processing() - only active batches
+            models.Index(
+                fields=['created_at'],
+                name='ib_active_idx',
+                condition=Q(status__in=['PENDING', 'PROCESSING'])
+            ),
+            # JSONB containment (@>) lookups, e.g. batches that hit an error type
+            GinIndex(fields=['error_log'], name='ib_errlog_gin', opclasses=['jsonb_path_ops']),
+            # Chunk-level duplicate detection (file_chunks @> [{"sha256": ...}])
+            GinIndex(fields=['file_chunks'], name='ib_chunks_gin', opclasses=['jsonb_path_ops']),
         ]
     
     def __str__(self):
@@ -422,6 +833,15 @@ class DataQualityFlag(models.Model):
     object_id = models.IntegerField(
         help_text="ID of the flagged object"
     )
+    content_type_fk = models.ForeignKey(
+        ContentType,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Content type of the flagged object (derived from content_type)"
+    )
+    content_object = GenericForeignKey('content_type_fk', 'object_id')
     field_name = models.CharField(
         max_length=100,
         blank=True,
@@ -492,6 +912,11 @@ class DataQualityFlag(models.Model):
     # MODEL METHODS
     # =============================================================================
     
+    def save(self, *args, **kwargs):
+        """Keep the generic relation in sync with the content_type label."""
+        self.content_type_fk = get_flag_content_type(self.content_type)
+        super().save(*args, **kwargs)
+    
     def resolve(self, user, notes=""):
         """Mark flag as resolved."""
         self.is_resolved = True
@@ -501,51 +926,131 @@ class DataQualityFlag(models.Model):
         self.save()
     
     def get_object(self):
-        """Get the flagged object instance."""
-        if self.content_type == 'shopping_center':
-            from properties.models import ShoppingCenter
-            try:
-                return ShoppingCenter.objects.get(id=self.object_id)
-            except ShoppingCenter.DoesNotExist:
-                return None
-        elif self.content_type == 'tenant':
-            from properties.models import Tenant
-            try:
-                return Tenant.objects.get(id=self.object_id)
-            except Tenant.DoesNotExist:
-                return None
-        return None
+        """
+        Get the flagged object instance.
+        
+        Resolved through the generic relation; list views should use
+        DataQualityFlag.objects.with_objects() so the objects are prefetched
+        in one query per content type instead of one query per flag.
+        Legacy rows without content_type_fk fall back to the label registry.
+        """
+        if self.content_type_fk_id is not None:
+            return self.content_object
+        model = get_flag_model(self.content_type)
+        return model and model.objects.filter(pk=self.object_id).first()
     
     def get_severity_color(self):
         """Get color code for UI display based on severity."""
-        colors = {
-            1: '#28a745',  # Green - Low
-            2: '#ffc107',  # Yellow - Medium
-            3: '#fd7e14',  # Orange - High
-            4: '#dc3545',  # Red - Critical
-            5: '#6f42c1',  # Purple - Blocker
-        }
-        return colors.get(self.severity, '#6c757d')
+        if 1 <= self.severity <= 5:
+            return _SEVERITY_COLORS[self.severity]
+        return _SEVERITY_COLORS[0]
     
     def get_age_days(self):
         """Get age of flag in days."""
         return (timezone.now() - self.created_at).days
-    
+
+    # Column order used by fast_insert()
+    FAST_INSERT_COLUMNS = (
+        'import_batch_id',
+        'flag_type',
+        'severity',
+        'content_type',
+        'content_type_fk_id',
+        'object_id',
+        'field_name',
+        'message',
+        'current_value',
+        'suggested_value',
+        'context_data',
+        'is_resolved',
+        'resolution_notes',
+        'created_at',
+        'updated_at',
+    )
+
+    @classmethod
+    def fast_insert(cls, rows_iterable, batch_size=10000):
+        """
+        Stream flags into the table with PostgreSQL COPY.
+
+        Bypasses model instantiation, signals and per-row parameter binding
+        for very large imports; prefer create_quality_flags_bulk() for
+        anything that needs the created instances back. Rows are dicts using
+        create_quality_flag() keyword arguments (import_batch or
+        import_batch_id). The timestamps and resolution defaults that
+        Django would normally fill in are supplied here.
+
+        Args:
+            rows_iterable: Iterable of flag dicts
+            batch_size: Maximum rows sent per COPY statement
+
+        Returns:
+            Number of rows written
+        """
+        table_name = connection.ops.quote_name(cls._meta.db_table)
+        copy_sql = f"COPY {table_name} ({', '.join(cls.FAST_INSERT_COLUMNS)}) FROM STDIN"
+        now = timezone.now()
+        content_type_ids = {}
+        rows = iter(rows_iterable)
+        written = 0
+
+        with connection.cursor() as cursor:
+            while True:
+                chunk = list(islice(rows, batch_size))
+                if not chunk:
+                    break
+
+                # psycopg 3 COPY: rows are adapted and buffered by the driver
+                with cursor.copy(copy_sql) as copy:
+                    for row in chunk:
+                        import_batch = row.get('import_batch')
+                        label = row['content_type']
+                        if label not in content_type_ids:
+                            content_type = get_flag_content_type(label)
+                            content_type_ids[label] = content_type.pk if content_type else None
+                        copy.write_row((
+                            import_batch.pk if import_batch is not None else row['import_batch_id'],
+                            row['flag_type'],
+                            row.get('severity', 2),
+                            label,
+                            content_type_ids[label],
+                            row['object_id'],
+                            row.get('field_name'),
+                            row['message'],
+                            row.get('current_value'),
+                            row.get('suggested_value'),
+                            json.dumps(row.get('context_data') or {}),
+                            False,
+                            '',
+                            now,
+                            now,
+                        ))
+                written += len(chunk)
+
+        return written
+
     # =============================================================================
     # MODEL CONFIGURATION
     # =============================================================================
     
     class Meta:
         db_table = 'data_quality_flags'
-        ordering = ['-severity', '-created_at']
         verbose_name = 'Data Quality Flag'
         verbose_name_plural = 'Data Quality Flags'
         
         indexes = [
             models.Index(fields=['content_type', 'object_id']),
+            models.Index(fields=['content_type_fk', 'object_id']),
             models.Index(fields=['is_resolved', 'severity']),
             models.Index(fields=['import_batch', 'flag_type']),
             models.Index(fields=['created_at']),
+            # Partial index for unresolved()/high_severity() dashboards - open flags only
+            models.Index(
+                fields=['severity', 'created_at'],
+                name='dqf_open_idx',
+                condition=Q(is_resolved=False)
+            ),
+            GinIndex(fields=['context_data'], name='dqf_context_gin', opclasses=['jsonb_path_ops']),
         ]
     
     def __str__(self):
@@ -622,9 +1127,27 @@ class ImportMappingConfig(models.Model):
         db_table = 'import_mapping_configs'
         ordering = ['-last_used_at', 'name']
         unique_together = [['name', 'import_type']]
+        
+        indexes = [
+            GinIndex(fields=['column_mapping'], name='imc_mapping_gin', opclasses=['jsonb_path_ops']),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.get_import_type_display()})"
+    
+    def record_use(self):
+        """
+        Record that this mapping was used for an import.
+        
+        Increments usage_count in the database with one UPDATE, so
+        concurrent imports don't lose updates to a read-modify-write save().
+        """
+        now = timezone.now()
+        ImportMappingConfig.objects.filter(pk=self.pk).update(
+            usage_count=F('usage_count') + 1,
+            last_used_at=now
+        )
+        self.last_used_at = now
 
 
 # =============================================================================
@@ -651,14 +1174,37 @@ class ImportBatchManager(models.Manager):
         return self.filter(status='FAILED')
     
     def recent(self, days=30):
-        """Get batches from recent days."""
+        """Get batches from recent days, newest first."""
         from datetime import date, timedelta
         cutoff_date = date.today() - timedelta(days=days)
-        return self.filter(created_at__date__gte=cutoff_date)
+        return self.filter(created_at__date__gte=cutoff_date).order_by('-created_at')
+    
+    def dashboard(self):
+        """
+        Get batches with only the columns dashboards show.
+        
+        Skips the JSONB columns (error_log, import_config, file_chunks) so
+        list/count views don't fetch and decode them.
+        """
+        return self.get_queryset().only(
+            'id', 'status', 'created_at',
+            'total_records', 'successful_records', 'failed_records'
+        )
     
     def by_user(self, user):
         """Get batches created by specific user."""
         return self.filter(created_by=user)
+    
+    def with_error_type(self, error_type):
+        """Get batches whose error log contains an error of the given type (GIN-indexed)."""
+        return self.filter(error_log__contains={'errors': [{'type': error_type}]})
+    
+    def with_chunks(self, chunk_hashes):
+        """Get batches whose file shares any of the given chunk hashes (GIN-indexed)."""
+        query = Q()
+        for chunk_hash in chunk_hashes:
+            query |= Q(file_chunks__contains=[{'sha256': chunk_hash}])
+        return self.filter(query) if query else self.none()
 
 
 class DataQualityFlagManager(models.Manager):
@@ -689,6 +1235,23 @@ class DataQualityFlagManager(models.Manager):
             content_type='tenant',
             object_id=tenant_id
         )
+    
+    def with_objects(self):
+        """Get flags with their flagged objects prefetched (one query per content type)."""
+        return self.select_related('content_type_fk').prefetch_related('content_object')
+    
+    def sync_content_types(self):
+        """
+        Backfill content_type_fk for flags stored before the generic relation.
+        
+        Issues one UPDATE per content_type label; returns rows updated.
+        """
+        updated = 0
+        for label in FLAG_CONTENT_TYPE_MODELS:
+            updated += self.filter(content_type=label, content_type_fk__isnull=True).update(
+                content_type_fk=get_flag_content_type(label)
+            )
+        return updated
 
 
 # Add custom managers to models
@@ -735,42 +1298,125 @@ def create_quality_flag(import_batch, content_type, object_id, flag_type,
     )
 
 
+def create_quality_flags_bulk(flags_iterable, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True):
+    """
+    Create many quality flags with multi-row INSERTs.
+
+    Importers should accumulate flags while processing a file and hand
+    them over once per file/chunk instead of calling create_quality_flag()
+    per row.
+
+    Args:
+        flags_iterable: Iterable of dicts using create_quality_flag() keyword
+            arguments (import_batch, content_type, object_id, flag_type,
+            message, and optionally field_name, current_value,
+            suggested_value, severity, context_data)
+        batch_size: Rows per INSERT; defaults to BULK_BATCH_SIZE
+        ignore_conflicts: Skip rows that collide with a unique constraint
+            instead of aborting the whole batch
+
+    Returns:
+        List of DataQualityFlag instances (without primary keys when
+        ignore_conflicts is set)
+    """
+    flags = iter(flags_iterable)
+    created = []
+
+    # Build instances one batch at a time so huge imports stay bounded in memory
+    while True:
+        objs = [
+            DataQualityFlag(
+                severity=flag.get('severity', 2),
+                context_data=flag.get('context_data') or {},
+                # bulk_create skips save(), so set the generic relation here
+                content_type_fk=get_flag_content_type(flag['content_type']),
+                **{key: value for key, value in flag.items()
+                   if key not in ('severity', 'context_data')}
+            )
+            for flag in islice(flags, batch_size)
+        ]
+        if not objs:
+            break
+        created.extend(DataQualityFlag.objects.bulk_create(
+            objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts
+        ))
+
+    return created
+
+
+# Dashboard statistics cache; the generation counter is bumped whenever a
+# batch finishes so every cached `days` window is invalidated at once
+IMPORT_STATS_CACHE_TIMEOUT = 60
+IMPORT_STATS_GENERATION_KEY = 'import_stats_generation'
+
+
+def invalidate_import_statistics():
+    """Invalidate all cached get_import_statistics() results."""
+    try:
+        cache.incr(IMPORT_STATS_GENERATION_KEY)
+    except ValueError:
+        cache.set(IMPORT_STATS_GENERATION_KEY, 1, None)
+
+
 def get_import_statistics(days=30):
     """
     Get comprehensive import statistics for dashboard display.
     
+    Results are cached for IMPORT_STATS_CACHE_TIMEOUT seconds and
+    invalidated when an import batch is marked completed.
+    
     Args:
         days: Number of days to include in statistics
     
     Returns:
         Dictionary with import statistics
     """
+    generation = cache.get_or_set(IMPORT_STATS_GENERATION_KEY, 0, None)
+    return cache.get_or_set(
+        f"import_stats_{generation}_{days}",
+        lambda: _calculate_import_statistics(days),
+        IMPORT_STATS_CACHE_TIMEOUT
+    )
+
+
+def _calculate_import_statistics(days):
+    """Run the aggregate queries behind get_import_statistics()."""
     from datetime import date, timedelta
     cutoff_date = date.today() - timedelta(days=days)
     
     recent_batches = ImportBatch.objects.filter(created_at__date__gte=cutoff_date)
     
+    # One query for all batch metrics (conditional aggregates via FILTER)
+    batch_totals = recent_batches.aggregate(
+        total_batches=models.Count('id'),
+        completed_batches=models.Count('id', filter=Q(status__in=['COMPLETED', 'PARTIAL'])),
+        failed_batches=models.Count('id', filter=Q(status='FAILED')),
+        processing_batches=models.Count('id', filter=Q(status='PROCESSING')),
+        total_records=models.Sum('total_records'),
+        successful_records=models.Sum('successful_records'),
+    )
+    
+    # One query for both flag counts
+    flag_totals = DataQualityFlag.objects.filter(is_resolved=False).aggregate(
+        unresolved_flags=models.Count('id'),
+        high_severity_flags=models.Count('id', filter=Q(severity__gte=4)),
+    )
+    
     stats = {
-        'total_batches': recent_batches.count(),
-        'completed_batches': recent_batches.filter(status__in=['COMPLETED', 'PARTIAL']).count(),
-        'failed_batches': recent_batches.filter(status='FAILED').count(),
-        'processing_batches': recent_batches.filter(status='PROCESSING').count(),
-        'total_records_processed': recent_batches.aggregate(
-            total=models.Sum('total_records')
-        )['total'] or 0,
+        'total_batches': batch_totals['total_batches'],
+        'completed_batches': batch_totals['completed_batches'],
+        'failed_batches': batch_totals['failed_batches'],
+        'processing_batches': batch_totals['processing_batches'],
+        'total_records_processed': batch_totals['total_records'] or 0,
         'success_rate': 0,
-        'unresolved_flags': DataQualityFlag.objects.filter(is_resolved=False).count(),
-        'high_severity_flags': DataQualityFlag.objects.filter(
-            is_resolved=False, severity__gte=4
-        ).count(),
+        'unresolved_flags': flag_totals['unresolved_flags'],
+        'high_severity_flags': flag_totals['high_severity_flags'],
     }
     
     # Calculate overall success rate
     total_records = stats['total_records_processed']
     if total_records > 0:
-        successful_records = recent_batches.aggregate(
-            total=models.Sum('successful_records')
-        )['total'] or 0
+        successful_records = batch_totals['successful_records'] or 0
         stats['success_rate'] = round((successful_records / total_records) * 100, 2)
     
     return stats
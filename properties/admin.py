@@ -7,8 +7,27 @@ from django.contrib.gis import admin as gis_admin
 from .models import ShoppingCenter, Tenant
 
 
+class ChangelistOnlyMixin:
+    """
+    Load only the columns the changelist renders.
+    
+    Change/add views still get full rows; the restriction applies to the
+    changelist (and its actions) via changelist_only_fields.
+    """
+    
+    changelist_only_fields = ()
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        opts = self.model._meta
+        match = getattr(request, 'resolver_match', None)
+        if match and match.url_name == f'{opts.app_label}_{opts.model_name}_changelist':
+            queryset = queryset.only(*self.changelist_only_fields)
+        return queryset
+
+
 @admin.register(ShoppingCenter)
-class ShoppingCenterAdmin(admin.ModelAdmin):
+class ShoppingCenterAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     """
     Modern Django 5.0 admin for ShoppingCenter with GIS support
     Geographic fields automatically get appropriate widgets
@@ -28,7 +47,8 @@ class ShoppingCenterAdmin(admin.ModelAdmin):
         'center_type',
         'address_state',
         'address_city',
-        'data_quality_score',
+        # data_quality_score (0-100) is sortable in the list instead of a
+        # filter - one facet per score value is 101 COUNTs
         'created_at'
     ]
     
@@ -107,15 +127,26 @@ class ShoppingCenterAdmin(admin.ModelAdmin):
         })
     )
     
-    # Enable facet counts (Django 5.0 feature)
-    show_facets = admin.ShowFacets.ALWAYS
+    # Facet counts (Django 5.0 feature) run one COUNT per filter value, so
+    # only compute them when the user asks for them
+    show_facets = admin.ShowFacets.ALLOW
     
-    # Optimize database queries
-    list_select_related = ['import_batch', 'last_import_batch']
+    # Optimize database queries - no related objects in list_display
+    list_select_related = False
+    changelist_only_fields = (
+        'id',
+        'shopping_center_name',
+        'address_city',
+        'address_state',
+        'center_type',
+        'total_gla',
+        'data_quality_score',
+        'created_at',
+    )
 
 
 @admin.register(Tenant)
-class TenantAdmin(admin.ModelAdmin):
+class TenantAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     """
     Modern Django 5.0 admin for Tenant management
     """
@@ -125,14 +156,12 @@ class TenantAdmin(admin.ModelAdmin):
         'shopping_center',
         'tenant_suite_number', 
         'square_footage',
-        'retail_category',
-        'lease_status'
+        'retail_category'
     ]
     
     list_filter = [
         'retail_category',
         'ownership_type',
-        'lease_status',
         'credit_category',
         'shopping_center__center_type',
         'shopping_center__address_state'
@@ -168,7 +197,6 @@ class TenantAdmin(admin.ModelAdmin):
         }),
         ('Lease Information', {
             'fields': (
-                'lease_status',
                 'base_rent',
                 'lease_term',
                 'lease_commence',
@@ -194,24 +222,21 @@ class TenantAdmin(admin.ModelAdmin):
         })
     )
     
-    # Enable facet counts (Django 5.0 feature)
-    show_facets = admin.ShowFacets.ALWAYS
+    # Facet counts (Django 5.0 feature) run one COUNT per filter value, so
+    # only compute them when the user asks for them
+    show_facets = admin.ShowFacets.ALLOW
     
     # Optimize database queries
-    list_select_related = ['shopping_center', 'import_batch', 'last_import_batch']
-    
-    # Custom admin actions
-    actions = ['mark_lease_active', 'mark_lease_expired']
-    
-    def mark_lease_active(self, request, queryset):
-        queryset.update(lease_status='ACTIVE')
-        self.message_user(request, f"Marked {queryset.count()} tenants as active")
-    mark_lease_active.short_description = "Mark selected tenants as active"
-    
-    def mark_lease_expired(self, request, queryset):
-        queryset.update(lease_status='EXPIRED') 
-        self.message_user(request, f"Marked {queryset.count()} tenants as expired")
-    mark_lease_expired.short_description = "Mark selected tenants as expired"
+    list_select_related = ['shopping_center']
+    changelist_only_fields = (
+        'id',
+        'tenant_name',
+        'tenant_suite_number',
+        'square_footage',
+        'retail_category',
+        'shopping_center',
+        'shopping_center__shopping_center_name',
+    )
 
 
 # Optional: Import batch admin if you want to manage import history
@@ -235,13 +260,16 @@ try:
             'created_at'
         ]
         
+        # ImportBatch has no default Meta.ordering
+        ordering = ['-created_at']
+        
         readonly_fields = [
             'id',
             'created_at',
             'updated_at'
         ]
         
-        show_facets = admin.ShowFacets.ALWAYS
+        show_facets = admin.ShowFacets.ALLOW
 
 except ImportError:
     # ImportBatch model not available yet
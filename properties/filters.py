@@ -17,11 +17,34 @@ filtering based on EXTRACT, DETERMINE, and DEFINE field categories.
 from django_filters import rest_framework as filters
 from django_filters import CharFilter, NumberFilter, BooleanFilter, DateFilter, ChoiceFilter
 from django.db import models
-from django.contrib.gis.geos import Point
+from django.contrib.gis.geos import Point, Polygon
 from django.contrib.gis.measure import D
 from decimal import Decimal
 
 from .models import ShoppingCenter, Tenant
+from services.spatial import bbox_envelopes_3857
+
+
+# =============================================================================
+# SPATIAL HELPERS
+# =============================================================================
+
+def map_bounds_q(sw_lat, sw_lng, ne_lat, ne_lng):
+    """
+    Q for shopping centers inside a map viewport.
+    
+    A bounding-box scan (&&) on the GiST-indexed Web Mercator column, so
+    the viewport edges follow constant latitude/longitude like the map does.
+    
+    Raises:
+        ValueError: If the bounds are out of range
+    """
+    condition = models.Q()
+    for envelope in bbox_envelopes_3857(sw_lat, sw_lng, ne_lat, ne_lng):
+        polygon = Polygon.from_bbox(envelope)
+        polygon.srid = 3857
+        condition |= models.Q(location_m__bboverlaps=polygon)
+    return condition
 
 
 # =============================================================================
@@ -409,14 +432,7 @@ class ShoppingCenterFilter(filters.FilterSet):
             if len(coords) != 4:
                 return queryset
             
-            sw_lat, sw_lng, ne_lat, ne_lng = coords
-            
-            return queryset.filter(
-                latitude__gte=sw_lat,
-                latitude__lte=ne_lat,
-                longitude__gte=sw_lng,
-                longitude__lte=ne_lng
-            )
+            return queryset.filter(map_bounds_q(*coords))
             
         except (ValueError, TypeError):
             return queryset
@@ -0,0 +1,172 @@
+# Generated by Django 5.0 on 2026-10-15 18:16
+
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.fields
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('imports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShoppingCenter',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('shopping_center_name', models.CharField(db_index=True, help_text='Unique identifier for the shopping center', max_length=255, unique=True)),
+                ('address_street', models.CharField(blank=True, help_text="Street address (e.g., '1371 Wilmington Pike')", max_length=255, null=True)),
+                ('address_city', models.CharField(blank=True, help_text='City name', max_length=100, null=True)),
+                ('address_state', models.CharField(blank=True, help_text="Two-letter state code (e.g., 'PA')", max_length=2, null=True)),
+                ('address_zip', models.CharField(blank=True, help_text='ZIP code (5 or 9 digit format)', max_length=10, null=True)),
+                ('contact_name', models.CharField(blank=True, help_text='Primary contact person', max_length=200, null=True)),
+                ('contact_phone', models.CharField(blank=True, help_text='Contact phone number', max_length=20, null=True)),
+                ('total_gla', models.IntegerField(blank=True, help_text='Total Gross Leasable Area in square feet', null=True, validators=[django.core.validators.MinValueValidator(0)])),
+                ('center_type', models.CharField(blank=True, choices=[('Strip/Convenience', 'Strip/Convenience (<30k SF)'), ('Neighborhood Center', 'Neighborhood Center (30k-125k SF)'), ('Community Center', 'Community Center (125k-400k SF)'), ('Regional Mall', 'Regional Mall (400k-800k SF)'), ('Super-Regional Mall', 'Super-Regional Mall (>800k SF)')], help_text='Calculated from GLA using ICSC standards', max_length=50, null=True)),
+                ('location', django.contrib.gis.db.models.fields.PointField(blank=True, help_text='PostGIS Point field for spatial queries', null=True, srid=4326)),
+                ('latitude', models.DecimalField(blank=True, decimal_places=7, help_text='Latitude coordinate (geocoded from address)', max_digits=10, null=True)),
+                ('longitude', models.DecimalField(blank=True, decimal_places=7, help_text='Longitude coordinate (geocoded from address)', max_digits=10, null=True)),
+                ('calculated_gla', models.IntegerField(blank=True, help_text='Sum of tenant square footage if total_gla missing', null=True)),
+                ('county', models.CharField(blank=True, help_text='County for regulatory and sorting purposes', max_length=100, null=True)),
+                ('municipality', models.CharField(blank=True, help_text='Municipality for zoning and regulations', max_length=100, null=True)),
+                ('zoning_authority', models.CharField(blank=True, help_text='Zoning authority or planning commission', max_length=200, null=True)),
+                ('year_built', models.IntegerField(blank=True, help_text='Year the shopping center was constructed', null=True, validators=[django.core.validators.MinValueValidator(1800), django.core.validators.MaxValueValidator(2100)])),
+                ('owner', models.CharField(blank=True, help_text='Property owner or ownership entity', max_length=255, null=True)),
+                ('property_manager', models.CharField(blank=True, help_text='Property management company', max_length=255, null=True)),
+                ('leasing_agent', models.CharField(blank=True, help_text='Leasing agent name', max_length=255, null=True)),
+                ('leasing_brokerage', models.CharField(blank=True, help_text='Leasing brokerage company', max_length=255, null=True)),
+                ('data_quality_score', models.IntegerField(default=0, help_text='Data completeness score (0-100)', validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('import_batch', models.ForeignKey(blank=True, help_text='Import batch that created this record', null=True, on_delete=django.db.models.deletion.SET_NULL, to='imports.importbatch')),
+                ('last_import_batch', models.ForeignKey(blank=True, help_text='Most recent import batch that updated this record', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='last_updated_centers', to='imports.importbatch')),
+            ],
+            options={
+                'verbose_name': 'Shopping Center',
+                'verbose_name_plural': 'Shopping Centers',
+                'db_table': 'shopping_centers',
+                'ordering': ['shopping_center_name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Tenant',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('tenant_name', models.CharField(db_index=True, help_text='Business name (can appear in multiple centers)', max_length=255)),
+                ('tenant_suite_number', models.CharField(blank=True, help_text='Suite/unit number within the shopping center', max_length=50, null=True)),
+                ('square_footage', models.IntegerField(blank=True, help_text='Leased square footage', null=True, validators=[django.core.validators.MinValueValidator(0)])),
+                ('retail_category', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=100), blank=True, default=list, help_text="Multiple retail categories (e.g., ['Restaurant', 'Fast Food'])", null=True, size=None)),
+                ('ownership_type', models.CharField(blank=True, choices=[('FRANCHISE', 'Franchise'), ('CORPORATE', 'Corporate'), ('INDEPENDENT', 'Independent'), ('CHAIN', 'Chain')], help_text='Business ownership structure', max_length=50, null=True)),
+                ('base_rent', models.DecimalField(blank=True, decimal_places=2, help_text='Base rent amount', max_digits=10, null=True)),
+                ('lease_term', models.IntegerField(blank=True, help_text='Lease term in months', null=True)),
+                ('lease_commence', models.DateField(blank=True, help_text='Lease commencement date', null=True)),
+                ('lease_expiration', models.DateField(blank=True, help_text='Lease expiration date', null=True)),
+                ('credit_category', models.CharField(blank=True, choices=[('AAA', 'AAA - Excellent Credit'), ('AA', 'AA - Very Good Credit'), ('A', 'A - Good Credit'), ('BBB', 'BBB - Fair Credit'), ('BB', 'BB - Below Average Credit'), ('B', 'B - Poor Credit'), ('UNKNOWN', 'Unknown Credit Rating')], help_text='Credit rating category', max_length=50, null=True)),
+                ('is_anchor', models.BooleanField(default=False, help_text='Is this tenant an anchor tenant?')),
+                ('occupancy_status', models.CharField(choices=[('OCCUPIED', 'Occupied'), ('VACANT', 'Vacant'), ('PENDING', 'Pending'), ('UNKNOWN', 'Unknown')], default='UNKNOWN', help_text='Current occupancy status', max_length=20)),
+                ('shopping_center', models.ForeignKey(help_text='Shopping center where this tenant is located', on_delete=django.db.models.deletion.CASCADE, related_name='tenants', to='properties.shoppingcenter')),
+            ],
+            options={
+                'verbose_name': 'Tenant',
+                'verbose_name_plural': 'Tenants',
+                'db_table': 'tenants',
+                'ordering': ['shopping_center', 'tenant_suite_number'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(fields=['shopping_center_name'], name='shopping_ce_shoppin_e5aff2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(fields=['address_city', 'address_state'], name='shopping_ce_address_73e55a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(fields=['center_type'], name='shopping_ce_center__7e90d0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(fields=['data_quality_score'], name='shopping_ce_data_qu_1fc6db_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(fields=['import_batch'], name='shopping_ce_import__81ed2d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(fields=['created_at'], name='shopping_ce_created_cb6365_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(fields=['updated_at'], name='shopping_ce_updated_4d5355_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='shoppingcenter',
+            constraint=models.CheckConstraint(check=models.Q(('total_gla__gte', 0)), name='positive_total_gla'),
+        ),
+        migrations.AddConstraint(
+            model_name='shoppingcenter',
+            constraint=models.CheckConstraint(check=models.Q(('data_quality_score__gte', 0), ('data_quality_score__lte', 100)), name='valid_quality_score'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['tenant_name'], name='tenants_tenant__d17221_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['shopping_center', 'tenant_name'], name='tenants_shoppin_7f40b2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['occupancy_status'], name='tenants_occupan_3c658b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['is_anchor'], name='tenants_is_anch_a44de1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['lease_expiration'], name='tenants_lease_e_f7c46f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['lease_commence'], name='tenants_lease_c_834446_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['base_rent'], name='tenants_base_re_1f9150_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['square_footage'], name='tenants_square__34f491_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['retail_category'], name='tenants_retail__8b5a86_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['ownership_type'], name='tenants_ownersh_92abda_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='tenant',
+            constraint=models.CheckConstraint(check=models.Q(('square_footage__gte', 0)), name='positive_square_footage'),
+        ),
+        migrations.AddConstraint(
+            model_name='tenant',
+            constraint=models.CheckConstraint(check=models.Q(('base_rent__gte', 0)), name='positive_base_rent'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='tenant',
+            unique_together={('shopping_center', 'tenant_suite_number')},
+        ),
+    ]
@@ -0,0 +1,167 @@
+# Generated by Django 5.0 on 2026-10-15 18:21
+
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+import django.db.models.expressions
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+def create_location_spgist_index(apps, schema_editor):
+    """
+    Optional SP-GiST index on location next to the GiST one (smaller for
+    point data), enabled with SPATIAL_SETTINGS['LOCATION_INDEX'] = 'spgist'
+    or 'both'. Kept out of the model state so the migration graph doesn't
+    depend on the environment; KNN ordering always uses sc_location_gist.
+    """
+    location_index = getattr(settings, 'SPATIAL_SETTINGS', {}).get('LOCATION_INDEX', 'gist')
+    if location_index in ('spgist', 'both'):
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS sc_location_spgist ON shopping_centers '
+            'USING spgist (location) WHERE location IS NOT NULL'
+        )
+
+
+def drop_location_spgist_index(apps, schema_editor):
+    schema_editor.execute('DROP INDEX IF EXISTS sc_location_spgist')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imports', '0002_flag_content_type_and_indexes'),
+        ('properties', '0001_initial'),
+    ]
+
+    operations = [
+        # pg_trgm for the gin_trgm_ops indexes below
+        TrigramExtension(),
+        migrations.RemoveIndex(
+            model_name='shoppingcenter',
+            name='shopping_ce_created_cb6365_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='shoppingcenter',
+            name='shopping_ce_updated_4d5355_idx',
+        ),
+        migrations.AddField(
+            model_name='shoppingcenter',
+            name='address_hash',
+            field=models.CharField(blank=True, editable=False, help_text='Hash of the address last geocoded (skips re-geocoding unchanged addresses)', max_length=16, null=True),
+        ),
+        # location becomes geography; geometry has an implicit cast but the
+        # USING clause keeps the conversion explicit. The spatial index the
+        # old field created is replaced by the partial sc_location_gist.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql='DROP INDEX IF EXISTS shopping_centers_location_id',
+                    reverse_sql='CREATE INDEX shopping_centers_location_id ON shopping_centers USING GIST (location)',
+                ),
+                migrations.RunSQL(
+                    sql='ALTER TABLE shopping_centers ALTER COLUMN location TYPE geography(Point, 4326) USING location::geography',
+                    reverse_sql='ALTER TABLE shopping_centers ALTER COLUMN location TYPE geometry(Point, 4326) USING location::geometry',
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='shoppingcenter',
+                    name='location',
+                    field=django.contrib.gis.db.models.fields.PointField(blank=True, geography=True, help_text='PostGIS Point field for spatial queries (kept in sync with latitude/longitude)', null=True, spatial_index=False, srid=4326),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='shoppingcenter',
+            name='geohash',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('location', output_field=models.CharField(max_length=9), template='ST_GeoHash(%(expressions)s::geometry, 9)'), help_text='Geohash of location (B-tree prefix prefilter for radius searches)', output_field=models.CharField(max_length=9)),
+        ),
+        migrations.AddField(
+            model_name='shoppingcenter',
+            name='location_m',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('location', output_field=django.contrib.gis.db.models.fields.PointField(srid=3857), template='ST_Transform(%(expressions)s::geometry, 3857)'), help_text='location projected to Web Mercator (planar bounding-box prefilters)', output_field=django.contrib.gis.db.models.fields.PointField(srid=3857)),
+        ),
+        # A column can't be altered into a generated column: drop the stored
+        # score (with its index and check constraint) and add it back generated
+        migrations.RemoveConstraint(
+            model_name='shoppingcenter',
+            name='valid_quality_score',
+        ),
+        migrations.RemoveIndex(
+            model_name='shoppingcenter',
+            name='shopping_ce_data_qu_1fc6db_idx',
+        ),
+        migrations.RemoveField(
+            model_name='shoppingcenter',
+            name='data_quality_score',
+        ),
+        migrations.AddField(
+            model_name='shoppingcenter',
+            name='data_quality_score',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Least(models.Value(100), django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.Case(models.When(models.Q(('shopping_center_name__isnull', False), models.Q(('shopping_center_name', ''), _negated=True)), then=models.Value(5)), default=models.Value(0), output_field=models.IntegerField()), '+', models.Case(models.When(models.Q(('address_street__isnull', False), models.Q(('address_street', ''), _negated=True)), then=models.Value(3)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('address_city__isnull', False), models.Q(('address_city', ''), _negated=True)), then=models.Value(3)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('address_state__isnull', False), models.Q(('address_state', ''), _negated=True)), then=models.Value(3)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('address_zip__isnull', False), models.Q(('address_zip', ''), _negated=True)), then=models.Value(3)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('contact_name__isnull', False), models.Q(('contact_name', ''), _negated=True)), then=models.Value(2)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('contact_phone__isnull', False), models.Q(('contact_phone', ''), _negated=True)), then=models.Value(2)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('total_gla__isnull', False), models.Q(('total_gla', 0), _negated=True)), then=models.Value(4)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('center_type__isnull', False), models.Q(('center_type', ''), _negated=True)), then=models.Value(8)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('latitude__isnull', False), models.Q(('latitude', 0), _negated=True)), then=models.Value(6)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('longitude__isnull', False), models.Q(('longitude', 0), _negated=True)), then=models.Value(6)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('owner__isnull', False), models.Q(('owner', ''), _negated=True)), then=models.Value(8)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('property_manager__isnull', False), models.Q(('property_manager', ''), _negated=True)), then=models.Value(8)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('county__isnull', False), models.Q(('county', ''), _negated=True)), then=models.Value(4)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('municipality__isnull', False), models.Q(('municipality', ''), _negated=True)), then=models.Value(4)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('zoning_authority__isnull', False), models.Q(('zoning_authority', ''), _negated=True)), then=models.Value(4)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('year_built__isnull', False), models.Q(('year_built', 0), _negated=True)), then=models.Value(4)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('leasing_agent__isnull', False), models.Q(('leasing_agent', ''), _negated=True)), then=models.Value(4)), default=models.Value(0), output_field=models.IntegerField())), '+', models.Case(models.When(models.Q(('leasing_brokerage__isnull', False), models.Q(('leasing_brokerage', ''), _negated=True)), then=models.Value(4)), default=models.Value(0), output_field=models.IntegerField())), output_field=models.IntegerField()), help_text='Data completeness score (0-100)', output_field=models.IntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(fields=['data_quality_score'], name='shopping_ce_data_qu_1fc6db_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='shoppingcenter',
+            constraint=models.CheckConstraint(check=models.Q(('data_quality_score__gte', 0), ('data_quality_score__lte', 100)), name='valid_quality_score'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='sc_created_brin', pages_per_range=32),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(fields=['-updated_at', '-id'], include=('shopping_center_name', 'address_city', 'address_state', 'center_type', 'total_gla', 'data_quality_score'), name='sc_updated_cover'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('location__isnull', False)), fields=['location'], name='sc_location_gist'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('location_m__isnull', False)), fields=['location_m'], name='sc_location_m_gist'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=models.Index(django.contrib.postgres.indexes.OpClass('geohash', name='varchar_pattern_ops'), condition=models.Q(('geohash__isnull', False)), name='sc_geohash_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('shopping_center_name'), name='gin_trgm_ops'), name='sc_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('address_city'), name='gin_trgm_ops'), name='sc_city_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('owner'), name='gin_trgm_ops'), name='sc_owner_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcenter',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('property_manager'), name='gin_trgm_ops'), name='sc_pm_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('tenant_name'), name='gin_trgm_ops'), name='tenant_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['-updated_at', '-id'], name='tenant_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['shopping_center', 'retail_category'], name='tenants_shoppin_222da1_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='shoppingcenter',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('shopping_center_name'), name='shoppingcenter_name_ci_uniq'),
+        ),
+        migrations.RunPython(create_location_spgist_index, drop_location_spgist_index),
+    ]
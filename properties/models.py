@@ -14,17 +14,85 @@ Business Rules Implemented:
 """
 
 from django.db import models
+from django.db.models import Case, Q, Value, When
+from django.db.models.functions import Least, Lower, Upper
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, GistIndex, OpClass
 from django.contrib.gis.db import models as gis_models
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.gis.geos import Point
 from django.utils import timezone
 from decimal import Decimal
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# DATA QUALITY SCORING
+# =============================================================================
+
+# Field completeness weights for the data quality score (max 100)
+# EXTRACT fields (40% of total score)
+EXTRACT_FIELD_WEIGHTS = {
+    'shopping_center_name': 5,
+    'address_street': 3,
+    'address_city': 3,
+    'address_state': 3,
+    'address_zip': 3,
+    'contact_name': 2,
+    'contact_phone': 2,
+    'total_gla': 4,
+}
+
+# DETERMINE fields (20% of total score)
+DETERMINE_FIELD_WEIGHTS = {
+    'center_type': 8,
+    'latitude': 6,
+    'longitude': 6,
+}
+
+# DEFINE fields (40% of total score)
+DEFINE_FIELD_WEIGHTS = {
+    'owner': 8,
+    'property_manager': 8,
+    'county': 4,
+    'municipality': 4,
+    'zoning_authority': 4,
+    'year_built': 4,
+    'leasing_agent': 4,
+    'leasing_brokerage': 4,
+}
+
+# Fields where 0 (rather than '') means "not filled in"
+NUMERIC_SCORE_FIELDS = {'total_gla', 'latitude', 'longitude', 'year_built'}
+
+
+def quality_score_expression():
+    """
+    SQL expression for the data quality score.
+    
+    Sum of the weights of the filled-in fields, capped at 100. A field
+    counts as filled when it is not NULL and not empty ('' or 0).
+    """
+    terms = []
+    for weights in (EXTRACT_FIELD_WEIGHTS, DETERMINE_FIELD_WEIGHTS, DEFINE_FIELD_WEIGHTS):
+        for field_name, weight in weights.items():
+            empty_value = 0 if field_name in NUMERIC_SCORE_FIELDS else ''
+            filled = Q(**{f'{field_name}__isnull': False}) & ~Q(**{field_name: empty_value})
+            terms.append(Case(
+                When(filled, then=Value(weight)),
+                default=Value(0),
+                output_field=models.IntegerField()
+            ))
+    
+    total = terms[0]
+    for term in terms[1:]:
+        total = total + term
+    return Least(Value(100), total, output_field=models.IntegerField())
+
+
 # =============================================================================
 # SHOPPING CENTER MODEL
 # =============================================================================
@@ -135,7 +203,29 @@ class ShoppingCenter(models.Model):
         blank=True, 
         null=True, 
         srid=4326,  # WGS84 coordinate system
-        help_text="PostGIS Point field for spatial queries"
+        geography=True,  # Distances/bounds in meters on the spheroid
+        spatial_index=False,  # Partial spatial indexes in Meta.indexes
+        help_text="PostGIS Point field for spatial queries (kept in sync with latitude/longitude)"
+    )
+    location_m = models.GeneratedField(
+        expression=models.Func(
+            'location',
+            template='ST_Transform(%(expressions)s::geometry, 3857)',
+            output_field=gis_models.PointField(srid=3857),
+        ),
+        output_field=gis_models.PointField(srid=3857),
+        db_persist=True,
+        help_text="location projected to Web Mercator (planar bounding-box prefilters)"
+    )
+    geohash = models.GeneratedField(
+        expression=models.Func(
+            'location',
+            template='ST_GeoHash(%(expressions)s::geometry, 9)',
+            output_field=models.CharField(max_length=9),
+        ),
+        output_field=models.CharField(max_length=9),
+        db_persist=True,
+        help_text="Geohash of location (B-tree prefix prefilter for radius searches)"
     )
     latitude = models.DecimalField(
         max_digits=10, 
@@ -151,6 +241,13 @@ class ShoppingCenter(models.Model):
         null=True,
         help_text="Longitude coordinate (geocoded from address)"
     )
+    address_hash = models.CharField(
+        max_length=16,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Hash of the address last geocoded (skips re-geocoding unchanged addresses)"
+    )
     
     # Calculated Fields
     calculated_gla = models.IntegerField(
@@ -221,9 +318,12 @@ class ShoppingCenter(models.Model):
     # METADATA FIELDS
     # =============================================================================
     
-    data_quality_score = models.IntegerField(
-        default=0,
-        validators=[MinValueValidator(0), MaxValueValidator(100)],
+    # Computed by PostgreSQL on every INSERT/UPDATE (stored generated column);
+    # call refresh_from_db() to read the new value after save()
+    data_quality_score = models.GeneratedField(
+        expression=quality_score_expression(),
+        output_field=models.IntegerField(),
+        db_persist=True,
         help_text="Data completeness score (0-100)"
     )
     
@@ -254,19 +354,19 @@ class ShoppingCenter(models.Model):
         
         Automatically calculates:
         - center_type from total_gla using ICSC standards
-        - data_quality_score based on field completeness
         - PostGIS Point from latitude/longitude coordinates
+        
+        data_quality_score is a generated column computed by the database.
         """
         # Calculate center type from GLA
         if self.total_gla and not self.center_type:
             self.center_type = self._calculate_center_type()
         
-        # Update PostGIS Point field from lat/lng
-        if self.latitude and self.longitude and not self.location:
-            self.location = Point(float(self.longitude), float(self.latitude))
-        
-        # Calculate data quality score
-        self.data_quality_score = self._calculate_quality_score()
+        # Keep PostGIS Point field in sync with lat/lng
+        if self.latitude is not None and self.longitude is not None:
+            self.location = Point(float(self.longitude), float(self.latitude), srid=4326)
+        else:
+            self.location = None
         
         # Update timestamp
         self.updated_at = timezone.now()
@@ -290,80 +390,17 @@ class ShoppingCenter(models.Model):
         else:
             return "Super-Regional Mall"
     
-    def _calculate_quality_score(self):
-        """
-        Calculate data quality score based on field completeness.
-        
-        Scoring weights:
-        - EXTRACT fields: 40%
-        - DETERMINE fields: 20%
-        - DEFINE fields: 40%
-        """
-        total_weight = 0
-        completed_weight = 0
-        
-        # EXTRACT fields (40% weight)
-        extract_fields = [
-            (self.shopping_center_name, 3),  # Required field, higher weight
-            (self.address_street, 2),
-            (self.address_city, 1.5),
-            (self.address_state, 1),
-            (self.address_zip, 1),
-            (self.contact_name, 1),
-            (self.contact_phone, 1),
-            (self.total_gla, 2),
-        ]
-        
-        for field_value, weight in extract_fields:
-            total_weight += weight
-            if field_value:
-                completed_weight += weight
-        
-        # DETERMINE fields (20% weight)
-        determine_fields = [
-            (self.center_type, 1.5),
-            (self.latitude and self.longitude, 2),
-            (self.calculated_gla, 1),
-        ]
-        
-        for field_value, weight in determine_fields:
-            total_weight += weight
-            if field_value:
-                completed_weight += weight
-        
-        # DEFINE fields (40% weight)
-        define_fields = [
-            (self.owner, 2),
-            (self.property_manager, 2),
-            (self.county, 1),
-            (self.municipality, 1),
-            (self.year_built, 1.5),
-            (self.leasing_agent, 1),
-            (self.leasing_brokerage, 1),
-            (self.zoning_authority, 1),
-        ]
-        
-        for field_value, weight in define_fields:
-            total_weight += weight
-            if field_value:
-                completed_weight += weight
-        
-        # Bonus for tenant data
-        if self.tenants.exists():
-            total_weight += 2
-            completed_weight += 2
-        
-        # Calculate percentage
-        if total_weight > 0:
-            return min(int((completed_weight / total_weight) * 100), 100)
-        return 0
-    
     def get_tenant_count(self):
         """Get total number of tenants in this shopping center."""
+        # Use the tenant_total annotation when the queryset provides it
+        if hasattr(self, 'tenant_total'):
+            return self.tenant_total
         return self.tenants.count()
     
     def get_occupied_tenant_count(self):
         """Get number of occupied tenant spaces."""
+        if hasattr(self, 'occupied_tenant_total'):
+            return self.occupied_tenant_total
         return self.tenants.filter(occupancy_status='OCCUPIED').count()
     
     def get_vacancy_rate(self):
@@ -385,6 +422,13 @@ class ShoppingCenter(models.Model):
         ]
         return ', '.join([part for part in address_parts if part])
     
+    def get_address_hash(self):
+        """Get a short hash of the full address, or None if there is no address."""
+        full_address = self.get_full_address()
+        if not full_address:
+            return None
+        return hashlib.blake2b(full_address.encode('utf-8'), digest_size=8).hexdigest()
+    
     # =============================================================================
     # MODEL CONFIGURATION
     # =============================================================================
@@ -404,10 +448,38 @@ class ShoppingCenter(models.Model):
             
             # Import tracking
             models.Index(fields=['import_batch']),
-            models.Index(fields=['created_at']),
-            models.Index(fields=['updated_at']),
+            # created_at follows insertion order, so BRIN (a few pages)
+            # serves time-range scans instead of a full B-tree
+            BrinIndex(fields=['created_at'], name='sc_created_brin', pages_per_range=32),
+            # Default API list ordering; INCLUDE covers the list columns
+            models.Index(
+                fields=['-updated_at', '-id'],
+                include=[
+                    'shopping_center_name', 'address_city', 'address_state',
+                    'center_type', 'total_gla', 'data_quality_score',
+                ],
+                name='sc_updated_cover'
+            ),
             
-            # Spatial queries (PostGIS will create spatial index automatically)
+            # Spatial queries - partial indexes: centers that aren't geocoded
+            # yet have no location and are never matched by spatial lookups
+            # (which are strict, so the planner can still use these)
+            # (SPATIAL_SETTINGS['LOCATION_INDEX'] can add an SP-GiST index
+            # next to this one, see migration 0002_generated_columns_and_indexes)
+            GistIndex(fields=['location'], name='sc_location_gist',
+                      condition=Q(location__isnull=False)),
+            GistIndex(fields=['location_m'], name='sc_location_m_gist',
+                      condition=Q(location_m__isnull=False)),
+            # Geohash prefix matches (LIKE 'abc%') need pattern ops
+            models.Index(OpClass('geohash', name='varchar_pattern_ops'), name='sc_geohash_prefix',
+                         condition=Q(geohash__isnull=False)),
+            
+            # Trigram indexes for SearchFilter: icontains compiles to
+            # UPPER(col::text) LIKE UPPER('%term%'), so index the same expression
+            GinIndex(OpClass(Upper('shopping_center_name'), name='gin_trgm_ops'), name='sc_name_trgm'),
+            GinIndex(OpClass(Upper('address_city'), name='gin_trgm_ops'), name='sc_city_trgm'),
+            GinIndex(OpClass(Upper('owner'), name='gin_trgm_ops'), name='sc_owner_trgm'),
+            GinIndex(OpClass(Upper('property_manager'), name='gin_trgm_ops'), name='sc_pm_trgm'),
         ]
         
         constraints = [
@@ -419,6 +491,11 @@ class ShoppingCenter(models.Model):
                 check=models.Q(data_quality_score__gte=0, data_quality_score__lte=100),
                 name='valid_quality_score'
             ),
+            # BUSINESS RULE: names are unique case-insensitively
+            models.UniqueConstraint(
+                Lower('shopping_center_name'),
+                name='shoppingcenter_name_ci_uniq'
+            ),
         ]
     
     def __str__(self):
@@ -571,6 +648,19 @@ class Tenant(models.Model):
     
     def save(self, *args, **kwargs):
         """Custom save method with business logic."""
+        self.apply_defaults()
+        
+        # Shopping center calculated_gla is refreshed on commit by the
+        # post_save receiver in signals.py
+        super().save(*args, **kwargs)
+    
+    def apply_defaults(self, tenant_count=None):
+        """
+        Fill in fields derived on save.
+        
+        bulk_create() skips save(), so bulk paths call this directly and
+        pass a running tenant_count instead of counting per tenant.
+        """
         # Auto-detect vacancy from tenant name
         if self.tenant_name and 'vacant' in self.tenant_name.lower():
             self.occupancy_status = 'VACANT'
@@ -580,26 +670,9 @@ class Tenant(models.Model):
         # Generate suite number if missing
         if not self.tenant_suite_number:
             # Use a simple counter or generate based on existing tenants
-            tenant_count = self.shopping_center.tenants.count()
+            if tenant_count is None:
+                tenant_count = self.shopping_center.tenants.count()
             self.tenant_suite_number = f'UNIT_{tenant_count + 1}'
-        
-        super().save(*args, **kwargs)
-        
-        # Update shopping center's calculated GLA if needed
-        if self.shopping_center.total_gla is None:
-            self._update_shopping_center_calculated_gla()
-    
-    def _update_shopping_center_calculated_gla(self):
-        """Update shopping center's calculated GLA from tenant square footage."""
-        from django.db.models import Sum
-        
-        total_sf = self.shopping_center.tenants.aggregate(
-            total=Sum('square_footage')
-        )['total']
-        
-        if total_sf:
-            self.shopping_center.calculated_gla = total_sf
-            self.shopping_center.save()
     
     def get_rent_per_sq_ft(self):
         """Calculate rent per square foot if data available."""
@@ -650,8 +723,12 @@ class Tenant(models.Model):
             # Core business queries
             models.Index(fields=['tenant_name']),
             models.Index(fields=['shopping_center', 'tenant_name']),
+            # Trigram index for SearchFilter icontains on tenant_name
+            GinIndex(OpClass(Upper('tenant_name'), name='gin_trgm_ops'), name='tenant_name_trgm'),
             models.Index(fields=['occupancy_status']),
             models.Index(fields=['is_anchor']),
+            # Default API list ordering
+            models.Index(fields=['-updated_at', '-id'], name='tenant_updated_idx'),
             
             # Lease management queries
             models.Index(fields=['lease_expiration']),
@@ -663,6 +740,8 @@ class Tenant(models.Model):
             
             # Category searches
             models.Index(fields=['retail_category']),
+            # Per-center category listing (analytics)
+            models.Index(fields=['shopping_center', 'retail_category']),
             models.Index(fields=['ownership_type']),
         ]
         
@@ -689,19 +768,8 @@ class Tenant(models.Model):
 # MODEL SIGNALS AND UTILITIES
 # =============================================================================
 
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
-
-@receiver(post_save, sender=Tenant)
-def update_shopping_center_on_tenant_save(sender, instance, created, **kwargs):
-    """Update shopping center data quality score when tenants are added/updated."""
-    instance.shopping_center.save()  # This will recalculate quality score
-
-@receiver(post_delete, sender=Tenant) 
-def update_shopping_center_on_tenant_delete(sender, instance, **kwargs):
-    """Update shopping center data quality score when tenants are deleted."""
-    if hasattr(instance, 'shopping_center') and instance.shopping_center:
-        instance.shopping_center.save()  # This will recalculate quality score
+# Tenant -> shopping center updates (quality score, GLA) are handled by the
+# receivers in properties/signals.py without re-saving the shopping center.
 
 
 # =============================================================================
@@ -726,6 +794,29 @@ class ShoppingCenterManager(models.Manager):
     def in_city_state(self, city, state):
         """Get shopping centers in specific city and state."""
         return self.filter(address_city__icontains=city, address_state__iexact=state)
+    
+    def backfill_locations(self):
+        """
+        Populate location from latitude/longitude for rows saved before it
+        was kept in sync. Single UPDATE; returns the number of rows updated.
+        """
+        from django.db import connection
+        from .signals import invalidate_nearby_cache
+        
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                UPDATE shopping_centers
+                SET location = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography
+                WHERE latitude IS NOT NULL
+                  AND longitude IS NOT NULL
+                  AND location IS NULL
+            """)
+            updated = cursor.rowcount
+        
+        # Raw SQL skips post_save; new locations add nearby results
+        if updated:
+            invalidate_nearby_cache()
+        return updated
 
 
 class TenantManager(models.Manager):
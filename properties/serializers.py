@@ -17,7 +17,7 @@ Key Features:
 
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
-from django.contrib.gis.geos import Point
+from django.db import transaction
 from decimal import Decimal, InvalidOperation
 from datetime import date, datetime
 import re
@@ -220,6 +220,22 @@ class TenantCreateSerializer(serializers.ModelSerializer):
         return value
 
 
+class TenantBulkCreateSerializer(TenantCreateSerializer):
+    """
+    Tenant serializer for bulk creation within one shopping center.
+    
+    The shopping center comes from the URL, and suite number uniqueness is
+    left to the database constraint instead of one exists() query per row.
+    """
+    
+    class Meta(TenantCreateSerializer.Meta):
+        fields = [
+            field for field in TenantCreateSerializer.Meta.fields
+            if field != 'shopping_center'
+        ]
+        validators = []
+
+
 # =============================================================================
 # SHOPPING CENTER SERIALIZERS
 # =============================================================================
@@ -403,24 +419,19 @@ class ShoppingCenterCreateSerializer(serializers.ModelSerializer):
             'manual_latitude',
             'manual_longitude',
         ]
+        # No UniqueValidator: a check-then-insert races, and the database
+        # constraint is case-insensitive (see ShoppingCenterViewSet._save_unique_name)
+        extra_kwargs = {
+            'shopping_center_name': {'validators': []},
+        }
     
     def validate_shopping_center_name(self, value):
-        """Validate shopping center name uniqueness."""
+        """Validate shopping center name (uniqueness is enforced on INSERT)."""
         if not value or not value.strip():
             raise serializers.ValidationError("Shopping center name is required.")
         
         # Clean the name
-        cleaned_name = value.strip()
-        
-        # Check for uniqueness (case-insensitive)
-        if ShoppingCenter.objects.filter(
-            shopping_center_name__iexact=cleaned_name
-        ).exists():
-            raise serializers.ValidationError(
-                f"Shopping center '{cleaned_name}' already exists. Shopping center names must be unique."
-            )
-        
-        return cleaned_name
+        return value.strip()
     
     def validate_address_state(self, value):
         """Validate state code format."""
@@ -518,25 +529,40 @@ class ShoppingCenterCreateSerializer(serializers.ModelSerializer):
         manual_latitude = validated_data.pop('manual_latitude', None)
         manual_longitude = validated_data.pop('manual_longitude', None)
         
-        # Create the shopping center
-        shopping_center = ShoppingCenter.objects.create(**validated_data)
-        
-        # Handle coordinate setting
+        # Manual or geocoded coordinates go into the INSERT itself
+        # (save() derives location)
         if override_coordinates and manual_latitude and manual_longitude:
-            shopping_center.latitude = manual_latitude
-            shopping_center.longitude = manual_longitude
-            shopping_center.location = Point(float(manual_longitude), float(manual_latitude))
-            shopping_center.save()
+            validated_data['latitude'] = manual_latitude
+            validated_data['longitude'] = manual_longitude
         else:
-            # Trigger geocoding (this would be handled by a signal or service)
-            try:
-                from services.geocoding import GeocodingService
-                geocoding_service = GeocodingService()
-                geocoding_service.geocode_shopping_center(shopping_center)
-            except Exception as e:
-                logger.warning(f"Geocoding failed for {shopping_center.shopping_center_name}: {str(e)}")
+            self._geocode_address(validated_data)
         
-        return shopping_center
+        # Create the shopping center
+        return ShoppingCenter.objects.create(**validated_data)
+    
+    def _geocode_address(self, validated_data):
+        """
+        Add coordinates geocoded from the address fields to validated_data,
+        with the address hash so an unchanged address isn't geocoded again.
+        Failures are logged and leave the center without coordinates.
+        """
+        from services.geocoding import geocode_address
+        
+        address = ShoppingCenter(**{
+            field: validated_data.get(field)
+            for field in ('address_street', 'address_city', 'address_state', 'address_zip')
+        })
+        full_address = address.get_full_address()
+        if not full_address:
+            return
+        
+        try:
+            validated_data['latitude'], validated_data['longitude'] = geocode_address(full_address)
+        except Exception as e:
+            # Geocoding failed, log but don't block creation
+            logger.warning(f"Geocoding failed for {full_address}: {str(e)}")
+            return
+        validated_data['address_hash'] = address.get_address_hash()
 
 
 class ShoppingCenterUpdateSerializer(serializers.ModelSerializer):
@@ -608,15 +634,8 @@ class ShoppingCenterUpdateSerializer(serializers.ModelSerializer):
         
         instance.save()
         
-        # Trigger re-geocoding if address changed
-        address_fields = ['address_street', 'address_city', 'address_state', 'address_zip']
-        if any(field in validated_data for field in address_fields):
-            try:
-                from services.geocoding import GeocodingService
-                geocoding_service = GeocodingService()
-                geocoding_service.geocode_shopping_center(instance)
-            except Exception as e:
-                logger.warning(f"Re-geocoding failed for {instance.shopping_center_name}: {str(e)}")
+        # Re-geocoding of changed addresses is scheduled after commit by
+        # ShoppingCenterViewSet.perform_update
         
         return instance
 
@@ -630,7 +649,9 @@ class ShoppingCenterMapSerializer(serializers.ModelSerializer):
     Minimal serializer optimized for map displays.
     
     Only includes essential data for map markers and popups.
-    Designed for high-performance bulk queries.
+    Designed for high-performance bulk queries: annotate the queryset with
+    tenant_total=Count('tenants'), otherwise the popup tenant count costs
+    one query per marker.
     """
     
     coordinates = serializers.SerializerMethodField()
@@ -667,6 +688,42 @@ class ShoppingCenterMapSerializer(serializers.ModelSerializer):
         }
 
 
+# Model columns read by ShoppingCenterNearbySerializer (for .only())
+NEARBY_FIELDS = (
+    'id',
+    'shopping_center_name',
+    'address_city',
+    'address_state',
+    'center_type',
+    'total_gla',
+    'data_quality_score',
+    'latitude',
+    'longitude',
+)
+
+
+class ShoppingCenterNearbySerializer(serializers.ModelSerializer):
+    """
+    Minimal serializer for nearby (radius) search results.
+    
+    Reads only NEARBY_FIELDS plus the query's distance annotation, so
+    views can load results with .only(*NEARBY_FIELDS).
+    """
+    
+    distance_miles = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ShoppingCenter
+        fields = [*NEARBY_FIELDS, 'distance_miles']
+    
+    def get_distance_miles(self, obj):
+        """Distance from the search point, from the query's distance annotation."""
+        distance = getattr(obj, 'distance', None)
+        if distance is None:
+            return None
+        return round(distance.mi, 2)
+
+
 class ShoppingCenterStatsSerializer(serializers.Serializer):
     """
     Statistics serializer for dashboard and analytics.
@@ -1,65 +1,92 @@
 # properties/signals.py
 # Backend Architect: Django signals for ShoppingCenter and Tenant models
-# Handles automated data quality scoring and relationship management
+# Handles calculated fields and relationship management
+# (data_quality_score is a database-generated column, see models.py)
 
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, OuterRef, Q, Subquery, Sum, When
+from django.db.models.functions import Coalesce, Now
 from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from .models import ShoppingCenter, Tenant
 
+logger = logging.getLogger(__name__)
 
-@receiver(pre_save, sender=ShoppingCenter)
-def calculate_shopping_center_quality_score(sender, instance, **kwargs):
-    """
-    Calculate data quality score before saving ShoppingCenter
-    Implements EXTRACT → DETERMINE → DEFINE quality methodology
+
+# =============================================================================
+# CALCULATED GLA (debounced per transaction)
+# =============================================================================
+
+# Shopping center ids whose calculated_gla needs recomputing, per thread
+_pending_gla = threading.local()
+
+
+def queue_gla_recalculation(shopping_center_id):
     """
-    score = 0
+    Recompute calculated_gla for a shopping center once the current
+    transaction commits.
     
-    # EXTRACT fields (40% of total score)
-    extract_fields = {
-        'shopping_center_name': 5,
-        'address_street': 3,
-        'address_city': 3, 
-        'address_state': 3,
-        'address_zip': 3,
-        'contact_name': 2,
-        'contact_phone': 2,
-        'total_gla': 4,
-    }
+    Every tenant saved in the same transaction adds to one set, and the
+    first on_commit callback to run recomputes the whole set with a single
+    UPDATE; the callbacks queued after it find the set empty. A bulk import
+    therefore costs one UPDATE on commit instead of an aggregate + UPDATE
+    per tenant. Outside a transaction the update runs immediately.
     
-    for field_name, weight in extract_fields.items():
-        if getattr(instance, field_name, None):
-            score += weight
+    Ids queued in a savepoint that is later rolled back stay in the set and
+    are recomputed with the rest, which is harmless: the UPDATE always
+    recomputes from the current tenants.
+    """
+    pending = getattr(_pending_gla, 'ids', None)
+    if pending is None:
+        pending = _pending_gla.ids = set()
+    pending.add(shopping_center_id)
     
-    # DETERMINE fields (20% of total score)  
-    determine_fields = {
-        'center_type': 8,
-        'latitude': 6,
-        'longitude': 6,
-    }
-    
-    for field_name, weight in determine_fields.items():
-        if getattr(instance, field_name, None):
-            score += weight
-            
-    # DEFINE fields (40% of total score)
-    define_fields = {
-        'owner': 8,
-        'property_manager': 8,
-        'county': 4,
-        'municipality': 4,
-        'zoning_authority': 4,
-        'year_built': 4,
-        'leasing_agent': 4,
-        'leasing_brokerage': 4,
-    }
+    # Runs immediately outside a transaction
+    transaction.on_commit(_flush_gla_recalculation)
+
+
+def _flush_gla_recalculation():
+    """on_commit callback for queue_gla_recalculation()."""
+    shopping_center_ids = getattr(_pending_gla, 'ids', None)
+    if not shopping_center_ids:
+        return
+    _pending_gla.ids = None
+    recalculate_calculated_gla(shopping_center_ids)
+
+
+def recalculate_calculated_gla(shopping_center_ids):
+    """
+    Set calculated_gla to the tenant square footage sum for the given
+    shopping centers that have no total_gla, in a single UPDATE.
     
-    for field_name, weight in define_fields.items():
-        if getattr(instance, field_name, None):
-            score += weight
+    Centers without tenants (e.g. the last one was deleted) get 0. Every
+    given center also has updated_at touched, so tenant changes show up in
+    the shopping center list ETag.
+    """
+    tenant_total = Tenant.objects.filter(
+        shopping_center_id=OuterRef('pk')
+    ).order_by().values('shopping_center_id').annotate(
+        total_sf=Sum('square_footage')
+    ).values('total_sf')
     
-    # Cap at 100 and set the score
-    instance.data_quality_score = min(score, 100)
+    # update() instead of save() avoids signal loops
+    ShoppingCenter.objects.filter(id__in=list(shopping_center_ids)).update(
+        calculated_gla=Case(
+            When(
+                Q(total_gla__isnull=True) | Q(total_gla=0),
+                then=Coalesce(Subquery(tenant_total), 0)
+            ),
+            default=F('calculated_gla')
+        ),
+        updated_at=Now()
+    )
+    # calculated_gla isn't part of nearby responses (NEARBY_FIELDS), so the
+    # nearby cache stays valid
 
 
 @receiver(post_save, sender=ShoppingCenter)
@@ -68,19 +95,9 @@ def update_calculated_gla(sender, instance, created, **kwargs):
     Update calculated_gla based on tenant square_footage sum
     Only runs if total_gla is not manually set
     """
-    if not instance.total_gla:
-        # Calculate GLA from tenant data
-        from django.db.models import Sum
-        tenant_total = instance.tenants.aggregate(
-            total_sf=Sum('square_footage')
-        )['total_sf']
-        
-        if tenant_total:
-            instance.calculated_gla = tenant_total
-            # Avoid infinite loop by using update() instead of save()
-            ShoppingCenter.objects.filter(id=instance.id).update(
-                calculated_gla=tenant_total
-            )
+    # A newly created shopping center has no tenants yet
+    if not created and not instance.total_gla:
+        queue_gla_recalculation(instance.id)
 
 
 @receiver(post_save, sender=Tenant)
@@ -90,29 +107,67 @@ def recalculate_shopping_center_gla(sender, instance, **kwargs):
     Recalculate shopping center GLA when tenants are added/removed/updated
     Maintains data integrity for calculated fields
     """
-    if instance.shopping_center and not instance.shopping_center.total_gla:
-        from django.db.models import Sum
-        
-        tenant_total = instance.shopping_center.tenants.aggregate(
-            total_sf=Sum('square_footage')
-        )['total_sf']
-        
-        # Update calculated_gla using update() to avoid signal loops
-        ShoppingCenter.objects.filter(id=instance.shopping_center.id).update(
-            calculated_gla=tenant_total or 0
-        )
+    if instance.shopping_center_id:
+        queue_gla_recalculation(instance.shopping_center_id)
 
 
-@receiver(post_save, sender=Tenant)
-def update_shopping_center_quality_score_on_tenant_change(sender, instance, **kwargs):
+# =============================================================================
+# NEARBY QUERY CACHE
+# =============================================================================
+
+# Cached nearby_properties responses are stored under this version number;
+# bumping it invalidates all of them without enumerating keys
+NEARBY_CACHE_VERSION_KEY = 'nearby:version'
+
+# Lifetime of cached responses and of the version itself. Writes go through
+# invalidate_nearby_cache() (ShoppingCenter saves/deletes, fast ingestion,
+# backfill_locations()); a write that bypasses it, e.g. raw SQL or a
+# queryset update() of nearby fields, is served stale for at most this long.
+NEARBY_CACHE_TIMEOUT = 300
+
+# Set when this thread has a pending on-commit invalidation
+_pending_nearby = threading.local()
+
+
+def _new_nearby_cache_version():
+    # Time-based, so a new version never matches responses cached under
+    # an earlier (expired or replaced) one
+    return time.time_ns()
+
+
+def get_nearby_cache_version():
+    """Current cache version for nearby_properties responses."""
+    return cache.get_or_set(NEARBY_CACHE_VERSION_KEY, _new_nearby_cache_version, NEARBY_CACHE_TIMEOUT)
+
+
+def invalidate_nearby_cache():
+    """
+    Invalidate every cached nearby_properties response once the current
+    transaction commits (immediately outside a transaction).
+    
+    Waiting for the commit keeps other requests from re-caching the old
+    rows in between; any number of calls in one transaction cost a single
+    cache write.
+    """
+    _pending_nearby.queued = True
+    transaction.on_commit(_flush_nearby_invalidation)
+
+
+def _flush_nearby_invalidation():
+    """on_commit callback for invalidate_nearby_cache()."""
+    if not getattr(_pending_nearby, 'queued', False):
+        return
+    _pending_nearby.queued = False
+    cache.set(NEARBY_CACHE_VERSION_KEY, _new_nearby_cache_version(), NEARBY_CACHE_TIMEOUT)
+
+
+@receiver(post_save, sender=ShoppingCenter)
+@receiver(post_delete, sender=ShoppingCenter)
+def expire_nearby_cache(sender, instance, **kwargs):
     """
-    Recalculate shopping center quality score when tenant data changes
-    Tenant count and details affect the shopping center's data quality
+    Shopping center changes can move, add or remove nearby results
     """
-    if instance.shopping_center:
-        # Trigger quality score recalculation
-        shopping_center = instance.shopping_center
-        shopping_center.save()  # This will trigger pre_save signal
+    invalidate_nearby_cache()
 
 
 # Optional: Logging signals for audit trail
@@ -121,10 +176,13 @@ def log_shopping_center_changes(sender, instance, created, **kwargs):
     """
     Log shopping center creation/updates for audit trail
     """
-    if created:
-        print(f"DEBUG: Created new shopping center: {instance.shopping_center_name}")
-    else:
-        print(f"DEBUG: Updated shopping center: {instance.shopping_center_name} (Quality Score: {instance.data_quality_score})")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug(
+        "shopping center %s %s (id=%s)",
+        "created" if created else "updated",
+        instance.shopping_center_name, instance.id
+    )
 
 
 @receiver(post_save, sender=Tenant)
@@ -132,10 +190,15 @@ def log_tenant_changes(sender, instance, created, **kwargs):
     """
     Log tenant creation/updates for audit trail  
     """
-    if created:
-        print(f"DEBUG: Added tenant {instance.tenant_name} to {instance.shopping_center.shopping_center_name}")
-    else:
-        print(f"DEBUG: Updated tenant {instance.tenant_name} in {instance.shopping_center.shopping_center_name}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    # shopping_center_id, not shopping_center.shopping_center_name, which
+    # would cost a SELECT per save
+    logger.debug(
+        "tenant %s %s in shopping center %s",
+        "created" if created else "updated",
+        instance.tenant_name, instance.shopping_center_id
+    )
 
 
 # Business rule enforcement signals
@@ -158,17 +221,10 @@ def validate_shopping_center_business_rules(sender, instance, **kwargs):
     """
     Enforce business rules before saving shopping centers
     """
-    # Ensure shopping center name is unique (case-insensitive)
+    # Case-insensitive name uniqueness is enforced by the
+    # shoppingcenter_name_ci_uniq database constraint
     if instance.shopping_center_name:
         instance.shopping_center_name = instance.shopping_center_name.strip()
-        
-        # Check for existing shopping center with same name (excluding current instance)
-        existing = ShoppingCenter.objects.filter(
-            shopping_center_name__iexact=instance.shopping_center_name
-        ).exclude(id=instance.id).exists()
-        
-        if existing:
-            raise ValueError(f"Shopping center '{instance.shopping_center_name}' already exists")
     
     # Normalize address fields
     if instance.address_city:
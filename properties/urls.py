@@ -32,6 +32,7 @@ api_urlpatterns = [
     
     # Spatial query endpoints
     path('nearby/', views.nearby_properties, name='nearby-properties'),
+    path('nearby/batch/', views.nearby_properties_batch, name='nearby-properties-batch'),
     
     # Shopping Centers - Custom Actions
     # Note: ViewSet actions are automatically included via router
@@ -96,6 +97,7 @@ UTILITY ENDPOINTS:
 GET    /api/v1/health/                              # Health check endpoint
 GET    /api/v1/info/                                # API information and statistics
 GET    /api/v1/nearby/?lat={lat}&lng={lng}&radius={miles}  # Find nearby properties
+POST   /api/v1/nearby/batch/                        # Properties in map tiles / viewport bbox
 
 IMPORT ENDPOINTS (Sprint 2):
 ============================
@@ -5,17 +5,21 @@ Django REST Framework views for shopping centers and tenants.
 Implements OpenAPI 3.0 specification from shopwindow-api-spec.txt
 """
 
-from django.db import transaction
-from django.db.models import Q, Count, Avg, Sum
-from django.db.models.functions import Distance
+import hashlib
+import math
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q, Count, Avg, Func, Max, Sum, Prefetch
 from django.shortcuts import get_object_or_404
 from django.contrib.gis.measure import D
-from django.contrib.gis.geos import Point
+from django.contrib.gis.geos import Point, Polygon
 from django.http import JsonResponse
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import condition, require_http_methods
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.utils import timezone
+from django.core.cache import cache
 
 from rest_framework import status, generics, filters
 from rest_framework.decorators import api_view, permission_classes
@@ -24,6 +28,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 
 from django_filters.rest_framework import DjangoFilterBackend
 
@@ -32,12 +37,21 @@ from .serializers import (
     ShoppingCenterSerializer,
     ShoppingCenterDetailSerializer,
     ShoppingCenterCreateSerializer,
+    ShoppingCenterNearbySerializer,
+    NEARBY_FIELDS,
     TenantSerializer,
-    TenantCreateSerializer
+    TenantCreateSerializer,
+    TenantBulkCreateSerializer
+)
+from .filters import ShoppingCenterFilter, TenantFilter, map_bounds_q
+from .signals import NEARBY_CACHE_TIMEOUT, get_nearby_cache_version, queue_gla_recalculation
+from services.business_logic import calculate_center_type
+from services.geocoding import geocode_shopping_center_by_id
+from services.spatial import (
+    geohash_cells_for_radius,
+    mercator_bbox_for_radius,
+    tile_envelope_3857,
 )
-from .filters import ShoppingCenterFilter, TenantFilter
-from services.business_logic import calculate_center_type, calculate_data_quality_score
-from services.geocoding import geocode_address
 
 
 # =============================================================================
@@ -55,6 +69,14 @@ class StandardResultsSetPagination(PageNumberPagination):
 # SHOPPING CENTER VIEWS
 # =============================================================================
 
+# Unique constraints on shopping_center_name: the case-insensitive one from
+# Meta.constraints and the column's own unique=True constraint
+SHOPPING_CENTER_NAME_CONSTRAINTS = frozenset({
+    'shoppingcenter_name_ci_uniq',
+    'shopping_centers_shopping_center_name_key',
+})
+
+
 class ShoppingCenterViewSet(ModelViewSet):
     """
     ViewSet for shopping center CRUD operations.
@@ -73,7 +95,7 @@ class ShoppingCenterViewSet(ModelViewSet):
     - Auto-geocode from address fields
     """
     
-    queryset = ShoppingCenter.objects.all().order_by('-updated_at')
+    queryset = ShoppingCenter.objects.all().order_by('-updated_at', '-id')
     pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = ShoppingCenterFilter
@@ -103,12 +125,12 @@ class ShoppingCenterViewSet(ModelViewSet):
         else:
             return ShoppingCenterSerializer
     
-    def get_queryset(self):
+    def get_base_queryset(self):
         """
-        Optimize queryset with prefetch_related for tenants
+        Shopping centers for this request, without per-action optimizations
         Add spatial filtering for map bounds if provided
         """
-        queryset = ShoppingCenter.objects.prefetch_related('tenants').select_related('import_batch')
+        queryset = ShoppingCenter.objects.all()
         
         # Map bounds filtering for frontend map interface
         bounds = self.request.query_params.get('bounds')
@@ -116,69 +138,101 @@ class ShoppingCenterViewSet(ModelViewSet):
             try:
                 # Format: "sw_lat,sw_lng,ne_lat,ne_lng"
                 sw_lat, sw_lng, ne_lat, ne_lng = map(float, bounds.split(','))
-                queryset = queryset.filter(
-                    latitude__gte=sw_lat,
-                    latitude__lte=ne_lat,
-                    longitude__gte=sw_lng,
-                    longitude__lte=ne_lng
-                )
+                queryset = queryset.filter(map_bounds_q(sw_lat, sw_lng, ne_lat, ne_lng))
             except (ValueError, TypeError):
                 pass  # Invalid bounds format, return all
         
-        return queryset.order_by('-updated_at')
+        return queryset
+    
+    def get_queryset(self):
+        """
+        Optimize queryset per action:
+        - list/retrieve annotate tenant counts instead of counting per row
+        - only retrieve prefetches tenants, restricted to the serialized columns
+        """
+        queryset = self.get_base_queryset()
+        
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.annotate(
+                tenant_total=Count('tenants'),
+                occupied_tenant_total=Count('tenants', filter=Q(tenants__occupancy_status='OCCUPIED')),
+            )
+        
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related(Prefetch(
+                'tenants',
+                queryset=Tenant.objects.only(
+                    'id', 'shopping_center_id', 'tenant_name', 'tenant_suite_number',
+                    'square_footage', 'retail_category', 'ownership_type',
+                    'occupancy_status', 'is_anchor', 'base_rent',
+                    'lease_commence', 'lease_expiration'
+                )
+            ))
+        
+        # id breaks updated_at ties so pages are stable (sc_updated_cover index)
+        return queryset.order_by('-updated_at', '-id')
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List shopping centers with conditional GET support.
+        
+        The weak ETag covers the request URL (bounds, filters, page) and the
+        state of the filtered rows, so repeated map pans over unchanged data
+        get a 304 without serializing the page.
+        """
+        etag = self._list_etag(request)
+        
+        if_none_match = request.headers.get('If-None-Match', '')
+        if etag in (tag.strip() for tag in if_none_match.split(',')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().list(request, *args, **kwargs)
+        
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, max-age=30'
+        return response
+    
+    def _list_etag(self, request):
+        """
+        Weak ETag from the request URL and the filtered rows' state.
+        
+        One aggregate over shopping_centers only: tenant changes touch the
+        parent's updated_at (see properties.signals), so no tenant join is needed.
+        """
+        state = self.filter_queryset(self.get_base_queryset()).order_by().aggregate(
+            etag_updated=Max('updated_at'),
+            etag_centers=Count('id'),
+        )
+        fingerprint = f"{request.get_full_path()}-{sorted(state.items())}"
+        return f'W/"{hashlib.md5(fingerprint.encode()).hexdigest()}"'
     
     def perform_create(self, serializer):
         """
         Custom create logic with business rules:
         - Enforce shopping center name uniqueness
         - Auto-calculate center_type from GLA
-        - Auto-geocode from address
+        - Auto-geocode from address (ShoppingCenterCreateSerializer.create)
         - Calculate initial quality score
         """
         with transaction.atomic():
-            # Check for existing shopping center with same name
-            name = serializer.validated_data.get('shopping_center_name')
-            if ShoppingCenter.objects.filter(shopping_center_name=name).exists():
-                return Response(
-                    {'error': f'Shopping center "{name}" already exists'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+            # Name uniqueness is checked by the INSERT itself (_save_unique_name)
             
             # Auto-calculate center_type from GLA
             gla = serializer.validated_data.get('total_gla')
             if gla:
                 serializer.validated_data['center_type'] = calculate_center_type(gla)
             
-            # Auto-geocode from address fields
-            address_fields = [
-                serializer.validated_data.get('address_street'),
-                serializer.validated_data.get('address_city'),
-                serializer.validated_data.get('address_state'),
-                serializer.validated_data.get('address_zip')
-            ]
-            
-            if any(address_fields):
-                full_address = ', '.join(filter(None, address_fields))
-                try:
-                    lat, lng = geocode_address(full_address)
-                    serializer.validated_data['latitude'] = lat
-                    serializer.validated_data['longitude'] = lng
-                except Exception as e:
-                    # Geocoding failed, log but don't block creation
-                    print(f"Geocoding failed for {full_address}: {str(e)}")
-            
-            # Save the instance
-            instance = serializer.save()
+            # Save the instance (the serializer geocodes before the INSERT)
+            instance = self._save_unique_name(serializer)
             
-            # Calculate initial data quality score
-            instance.data_quality_score = calculate_data_quality_score(instance)
-            instance.save(update_fields=['data_quality_score'])
+            # data_quality_score is generated by the database - read it back
+            instance.refresh_from_db(fields=['data_quality_score'])
     
     def perform_update(self, serializer):
         """
         Custom update logic with progressive enrichment:
         - Recalculate center_type if GLA changes
-        - Re-geocode if address changes
+        - Re-geocode if the address changes, after the transaction commits
         - Update quality score
         """
         with transaction.atomic():
@@ -190,36 +244,45 @@ class ShoppingCenterViewSet(ModelViewSet):
             if new_gla and new_gla != instance.total_gla:
                 serializer.validated_data['center_type'] = calculate_center_type(new_gla)
             
-            # Check if address changed, re-geocode
             address_fields = ['address_street', 'address_city', 'address_state', 'address_zip']
-            address_changed = any(
-                serializer.validated_data.get(field) != getattr(instance, field)
-                for field in address_fields
-                if field in serializer.validated_data
-            )
-            
-            if address_changed:
-                address_parts = [
-                    serializer.validated_data.get('address_street', instance.address_street),
-                    serializer.validated_data.get('address_city', instance.address_city),
-                    serializer.validated_data.get('address_state', instance.address_state),
-                    serializer.validated_data.get('address_zip', instance.address_zip)
-                ]
-                full_address = ', '.join(filter(None, address_parts))
-                
-                try:
-                    lat, lng = geocode_address(full_address)
-                    serializer.validated_data['latitude'] = lat
-                    serializer.validated_data['longitude'] = lng
-                except Exception as e:
-                    print(f"Re-geocoding failed for {full_address}: {str(e)}")
+            address_submitted = any(field in serializer.validated_data for field in address_fields)
             
             # Save the instance
-            updated_instance = serializer.save()
+            updated_instance = self._save_unique_name(serializer)
             
-            # Recalculate data quality score
-            updated_instance.data_quality_score = calculate_data_quality_score(updated_instance)
-            updated_instance.save(update_fields=['data_quality_score'])
+            # data_quality_score is generated by the database - read it back
+            updated_instance.refresh_from_db(fields=['data_quality_score'])
+            
+            # Re-geocode only if the address differs from the one last geocoded
+            address_hash = updated_instance.get_address_hash() if address_submitted else None
+            regeocode = bool(address_hash) and address_hash != updated_instance.address_hash
+        
+        # Outside the transaction so no row locks are held across the API
+        # call; reload so the response carries the new coordinates
+        if regeocode:
+            geocode_shopping_center_by_id(updated_instance.pk)
+            updated_instance.refresh_from_db(fields=[
+                'latitude', 'longitude', 'location', 'address_hash', 'data_quality_score',
+            ])
+    
+    def _save_unique_name(self, serializer):
+        """
+        Save the serializer, reporting a duplicate name as a 400.
+        
+        Name uniqueness (case-insensitive) is enforced by the database
+        constraint, which is race-free unlike a check-then-insert.
+        """
+        try:
+            with transaction.atomic():
+                return serializer.save()
+        except IntegrityError as e:
+            diag = getattr(e.__cause__, 'diag', None)
+            if getattr(diag, 'constraint_name', None) not in SHOPPING_CENTER_NAME_CONSTRAINTS:
+                raise
+            name = serializer.validated_data.get('shopping_center_name')
+            raise ValidationError(
+                {'shopping_center_name': [f'Shopping center "{name}" already exists']}
+            )
     
     @action(detail=True, methods=['get'])
     def tenants(self, request, pk=None):
@@ -255,10 +318,6 @@ class ShoppingCenterViewSet(ModelViewSet):
             with transaction.atomic():
                 tenant = serializer.save(shopping_center=shopping_center)
                 
-                # Recalculate shopping center quality score
-                shopping_center.data_quality_score = calculate_data_quality_score(shopping_center)
-                shopping_center.save(update_fields=['data_quality_score'])
-                
                 return Response(
                     TenantSerializer(tenant).data,
                     status=status.HTTP_201_CREATED
@@ -266,6 +325,50 @@ class ShoppingCenterViewSet(ModelViewSet):
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+    @action(detail=True, methods=['post'], url_path='tenants/bulk')
+    def bulk_add_tenants(self, request, pk=None):
+        """
+        Add many tenants to a specific shopping center in one request
+        POST /api/v1/shopping-centers/{id}/tenants/bulk/
+        
+        Uses bulk_create, so Tenant.save() and the Tenant pre/post_save
+        signals do not run per row: save-time defaults are applied here and
+        the shopping center's calculated GLA is refreshed once.
+        """
+        shopping_center = self.get_object()
+        
+        if not isinstance(request.data, list):
+            return Response(
+                {'error': 'Expected a list of tenants'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        serializer = TenantBulkCreateSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        
+        tenant_count = shopping_center.tenants.count()
+        tenants = []
+        for tenant_data in serializer.validated_data:
+            tenant = Tenant(shopping_center=shopping_center, **tenant_data)
+            tenant.apply_defaults(tenant_count=tenant_count)
+            tenant_count += 1
+            tenants.append(tenant)
+        
+        try:
+            with transaction.atomic():
+                created = Tenant.objects.bulk_create(tenants, batch_size=1000)
+                queue_gla_recalculation(shopping_center.id)
+        except IntegrityError as e:
+            return Response(
+                {'error': f'Tenants could not be added: {str(e)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(
+            {'created': len(created)},
+            status=status.HTTP_201_CREATED
+        )
+    
     @action(detail=True, methods=['get'])
     def analytics(self, request, pk=None):
         """
@@ -275,16 +378,30 @@ class ShoppingCenterViewSet(ModelViewSet):
         shopping_center = self.get_object()
         tenants = shopping_center.tenants.all()
         
+        # All counts and the SF total in one conditional aggregate
+        totals = tenants.aggregate(
+            total=Count('id'),
+            occupied=Count('id', filter=Q(occupancy_status='OCCUPIED')),
+            vacant=Count('id', filter=Q(occupancy_status='VACANT')),
+            anchors=Count('id', filter=Q(is_anchor=True)),
+            total_sf=Sum('square_footage'),
+        )
+        
         analytics_data = {
-            'total_tenants': tenants.count(),
-            'occupied_tenants': tenants.filter(occupancy_status='OCCUPIED').count(),
-            'vacant_suites': tenants.filter(occupancy_status='VACANT').count(),
-            'total_leased_sf': tenants.aggregate(total_sf=Sum('square_footage'))['total_sf'] or 0,
+            'total_tenants': totals['total'],
+            'occupied_tenants': totals['occupied'],
+            'vacant_suites': totals['vacant'],
+            'total_leased_sf': totals['total_sf'] or 0,
             'occupancy_rate': 0,
-            'anchor_tenants': tenants.filter(is_anchor=True).count(),
+            'anchor_tenants': totals['anchors'],
+            # Unique category names, unnested from the per-tenant arrays so the
+            # database returns one row per category instead of one per tenant
             'retail_categories': list(
                 tenants.exclude(retail_category__isnull=True)
-                .values_list('retail_category', flat=True)
+                .annotate(category=Func('retail_category', function='unnest'))
+                .order_by('category')
+                .values_list('category', flat=True)
+                .distinct()
             )
         }
         
@@ -317,7 +434,7 @@ class TenantViewSet(ModelViewSet):
     - Suite numbers must be unique within a center
     """
     
-    queryset = Tenant.objects.all().order_by('-updated_at')
+    queryset = Tenant.objects.all().order_by('-updated_at', '-id')
     serializer_class = TenantSerializer
     pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -327,7 +444,7 @@ class TenantViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Optimize queryset with shopping center relationship"""
-        return Tenant.objects.select_related('shopping_center').order_by('-updated_at')
+        return Tenant.objects.select_related('shopping_center').order_by('-updated_at', '-id')
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
@@ -340,6 +457,38 @@ class TenantViewSet(ModelViewSet):
 # HEALTH CHECK AND UTILITY VIEWS
 # =============================================================================
 
+def _estimated_table_counts():
+    """
+    Approximate row counts from the planner statistics in pg_class.
+    
+    One catalog lookup instead of a COUNT(*) scan per table; reltuples is
+    -1 for tables that have never been analyzed.
+    """
+    tables = {
+        ShoppingCenter._meta.db_table: 'shopping_centers',
+        Tenant._meta.db_table: 'tenants',
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relname, reltuples::bigint FROM pg_class WHERE relname = ANY(%s)",
+            [list(tables)]
+        )
+        counts = {tables[relname]: max(reltuples, 0) for relname, reltuples in cursor.fetchall()}
+    return {key: counts.get(key, 0) for key in tables.values()}
+
+
+def _api_stats():
+    """
+    Row count statistics for the info endpoints, cached for 5 minutes.
+    
+    The entry lives in the shared database cache, so every worker reads the
+    same counts; it is not invalidated on writes, so they can lag imports
+    and deletes by up to 300 seconds (the reltuples estimates lag further
+    until the next ANALYZE).
+    """
+    return cache.get_or_set('api_stats', _estimated_table_counts, 300)
+
+
 @api_view(['GET'])
 def health_check(request):
     """
@@ -347,18 +496,14 @@ def health_check(request):
     GET /api/v1/health/
     """
     try:
-        # Test database connectivity
-        shopping_center_count = ShoppingCenter.objects.count()
-        tenant_count = Tenant.objects.count()
+        # Test database connectivity with a single round-trip
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
         
         health_data = {
             'status': 'healthy',
             'service': 'shopwindow-backend',
             'database': 'connected',
-            'data': {
-                'shopping_centers': shopping_center_count,
-                'tenants': tenant_count
-            },
             'timestamp': timezone.now().isoformat()
         }
         
@@ -389,8 +534,8 @@ def api_info(request):
         'service': 'Shop Window Backend',
         'django_version': settings.DJANGO_VERSION if hasattr(settings, 'DJANGO_VERSION') else 'Unknown',
         'database': {
-            'shopping_centers': ShoppingCenter.objects.count(),
-            'tenants': Tenant.objects.count(),
+            # Estimated counts, refreshed at most every 5 minutes
+            **_api_stats(),
             'latest_import': 'Not implemented yet'  # TODO: Add import batch info
         },
         'features': {
@@ -408,46 +553,92 @@ def api_info(request):
 # SPATIAL QUERY VIEWS
 # =============================================================================
 
+# Bounds for the nearby_properties radius, in miles
+NEARBY_MIN_RADIUS_MILES = 0.1
+NEARBY_MAX_RADIUS_MILES = 50.0
+
+# Cache backends private to one process. The nearby cache version can only
+# back an ETag when every worker sees the same one, so none is issued on these.
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+NEARBY_ETAGS_ENABLED = settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def _parse_nearby_params(request):
+    """
+    Validated, quantized (lat, lng, radius_miles) for nearby_properties.
+    
+    Raises:
+        ValueError/TypeError: If a parameter is missing or invalid
+    """
+    lat = float(request.GET.get('lat'))
+    lng = float(request.GET.get('lng'))
+    radius_miles = float(request.GET.get('radius', 10))  # Default 10 miles
+    
+    # Reject NaN/infinity, out-of-range coordinates and negative radii
+    if not all(math.isfinite(value) for value in (lat, lng, radius_miles)):
+        raise ValueError("Non-finite coordinates or radius")
+    if abs(lat) > 90 or abs(lng) > 180 or radius_miles < 0:
+        raise ValueError("Coordinates or radius out of range")
+    
+    lat, lng = round(lat, 3), round(lng, 3)
+    radius_miles = min(max(radius_miles, NEARBY_MIN_RADIUS_MILES), NEARBY_MAX_RADIUS_MILES)
+    return lat, lng, radius_miles
+
+
+def _nearby_etag(request):
+    """
+    ETag for a nearby_properties response: the quantized query plus the
+    nearby cache version, which changes whenever a shopping center does.
+    No database query.
+    
+    None (no ETag) unless the cache is shared by all workers.
+    """
+    if not NEARBY_ETAGS_ENABLED:
+        return None
+    try:
+        lat, lng, radius_miles = _parse_nearby_params(request)
+    except (ValueError, TypeError):
+        return None  # Invalid request, answered with a 400
+    fingerprint = f"{lat}:{lng}:{radius_miles}:{get_nearby_cache_version()}"
+    return hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()
+
+
 @api_view(['GET'])
+@condition(etag_func=_nearby_etag)
 def nearby_properties(request):
     """
     Find shopping centers near a point
     GET /api/v1/nearby/?lat={lat}&lng={lng}&radius={miles}
+    
+    The radius is clamped to 0.1-50 miles so a huge radius can't turn
+    the query into a full table scan.
+    
+    Responses are cached for NEARBY_CACHE_TIMEOUT (5 minutes) per ~110 m
+    cell (lat/lng rounded to 3 decimals) and radius; shopping center changes
+    invalidate them on commit (see properties.signals for the staleness bound).
+    With a shared cache they carry an ETag, so repeat requests with
+    If-None-Match get a 304.
     """
     try:
-        lat = float(request.GET.get('lat'))
-        lng = float(request.GET.get('lng'))
-        radius_miles = float(request.GET.get('radius', 10))  # Default 10 miles
-        
-        # Create point and find nearby properties
-        point = Point(lng, lat, srid=4326)  # Note: Point(lng, lat) order
-        
-        # Filter properties with coordinates and calculate distance
-        nearby = ShoppingCenter.objects.filter(
-            latitude__isnull=False,
-            longitude__isnull=False
-        ).extra(
-            select={
-                'distance': """
-                    ST_Distance(
-                        ST_MakePoint(longitude, latitude)::geography,
-                        ST_MakePoint(%s, %s)::geography
-                    ) / 1609.34
-                """  # Convert meters to miles
-            },
-            select_params=[lng, lat]
-        ).extra(
-            where=['ST_Distance(ST_MakePoint(longitude, latitude)::geography, ST_MakePoint(%s, %s)::geography) / 1609.34 <= %s'],
-            params=[lng, lat, radius_miles]
-        ).order_by('distance')[:50]  # Limit to 50 results
-        
-        serializer = ShoppingCenterSerializer(nearby, many=True)
-        return Response({
-            'count': len(nearby),
-            'radius_miles': radius_miles,
-            'center_point': {'lat': lat, 'lng': lng},
-            'results': serializer.data
-        })
+        lat, lng, radius_miles = _parse_nearby_params(request)
+        
+        cache_key = f"nearby:{lat}:{lng}:{radius_miles}"
+        cache_version = get_nearby_cache_version()
+        data = cache.get(cache_key, version=cache_version)
+        cache_status = 'HIT'
+        if data is None:
+            data = _nearby_response_data(lat, lng, radius_miles)
+            cache.set(cache_key, data, NEARBY_CACHE_TIMEOUT, version=cache_version)
+            cache_status = 'MISS'
+        
+        # JsonResponse (DjangoJSONEncoder: decimals as strings, as DRF
+        # renders them) skips DRF's renderer/content negotiation
+        response = JsonResponse(data)
+        response['X-Cache'] = cache_status
+        return response
     
     except (ValueError, TypeError) as e:
         return Response(
@@ -461,6 +652,137 @@ def nearby_properties(request):
         )
 
 
+# Nearby search, nearest first. The CTE walks the GiST index on location
+# in KNN (<->) order and stops after 50 rows inside the radius; the outer
+# query re-sorts those by exact (sphere) distance. The prefilters are
+# cheap per-row checks: Web Mercator bounding box overlap and geohash
+# cells (NULL cells = no geohash prefilter). The SQL text never changes,
+# only its parameters, so the plan can be reused.
+NEARBY_SQL = """
+    WITH candidates AS (
+        SELECT {columns},
+               ST_Distance(location, %(point)s::geography, false) AS distance_m
+        FROM {table}
+        WHERE ST_DWithin(location, %(point)s::geography, %(radius_m)s, false)
+          AND (%(xmin)s::float8 IS NULL OR location_m && ST_MakeEnvelope(
+              %(xmin)s::float8, %(ymin)s::float8, %(xmax)s::float8, %(ymax)s::float8, 3857))
+          AND (%(cells)s::text[] IS NULL OR geohash LIKE ANY(%(cells)s::text[]))
+        ORDER BY location <-> %(point)s::geography
+        LIMIT 50
+    )
+    SELECT * FROM candidates ORDER BY distance_m
+"""
+
+
+def _nearby_response_data(lat, lng, radius_miles):
+    """Run the nearby query and return the serialized response body."""
+    # Create point and find nearby properties
+    point = Point(lng, lat, srid=4326)  # Note: Point(lng, lat) order
+    radius_m = D(mi=radius_miles).m
+    
+    # Planar prefilter on location_m: a Mercator box around the whole
+    # radius; skipped near the poles and across the antimeridian
+    xmin, ymin, xmax, ymax = mercator_bbox_for_radius(lat, lng, radius_m) or (None,) * 4
+    
+    # Geohash prefilter: the search point's cell and its neighbours, sized
+    # so they cover the whole radius
+    cells = geohash_cells_for_radius(lat, lng, radius_m)
+    
+    sql = NEARBY_SQL.format(
+        columns=', '.join(connection.ops.quote_name(field) for field in NEARBY_FIELDS),
+        table=connection.ops.quote_name(ShoppingCenter._meta.db_table),
+    )
+    params = {
+        'point': point.ewkt,
+        'radius_m': radius_m,
+        'xmin': xmin,
+        'ymin': ymin,
+        'xmax': xmax,
+        'ymax': ymax,
+        'cells': [f'{cell}%' for cell in cells] if cells else None,
+    }
+    
+    # Plain dicts straight from the cursor - no serializer on this hot
+    # read-only path; the row shape matches ShoppingCenterNearbySerializer
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        nearby = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    for row in nearby:
+        row['distance_miles'] = round(D(m=row.pop('distance_m')).mi, 2)
+    
+    return {
+        'count': len(nearby),
+        'radius_miles': radius_miles,
+        'center_point': {'lat': lat, 'lng': lng},
+        'results': nearby
+    }
+
+
+# Limits for nearby_properties_batch
+NEARBY_BATCH_MAX_TILES = 64
+NEARBY_BATCH_MAX_RESULTS = 500
+
+
+@api_view(['POST'])
+def nearby_properties_batch(request):
+    """
+    Shopping centers inside a map viewport, for map panning
+    POST /api/v1/nearby/batch/
+    
+    Body: {"tiles": [[z, x, y], ...]} (XYZ map tiles) and/or
+          {"bbox": [sw_lat, sw_lng, ne_lat, ne_lng]}
+    
+    One bounding-box scan on the indexed location_m column covers the
+    whole viewport instead of a nearby request per point.
+    """
+    if not isinstance(request.data, dict):
+        return Response(
+            {'error': 'Request body must be a JSON object'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        viewport_filter = Q()
+        
+        tiles = request.data.get('tiles') or []
+        if len(tiles) > NEARBY_BATCH_MAX_TILES:
+            raise ValueError(f"At most {NEARBY_BATCH_MAX_TILES} tiles per request")
+        for z, x, y in tiles:
+            envelope = Polygon.from_bbox(tile_envelope_3857(int(z), int(x), int(y)))
+            envelope.srid = 3857
+            viewport_filter |= Q(location_m__bboverlaps=envelope)
+        
+        bbox = request.data.get('bbox')
+        if bbox:
+            # Projected in Python: latitudes are clamped to the Mercator
+            # square, where a GDAL transform would fail beyond +/-85.05
+            viewport_filter |= map_bounds_q(*map(float, bbox))
+        
+        if not viewport_filter:
+            raise ValueError("Provide tiles or bbox")
+    
+    except (ValueError, TypeError) as e:
+        return Response(
+            {'error': f'Invalid tiles or bbox provided: {str(e)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    centers = list(
+        ShoppingCenter.objects.only(*NEARBY_FIELDS)
+        .filter(viewport_filter)
+        .order_by('id')[:NEARBY_BATCH_MAX_RESULTS]
+    )
+    
+    serializer = ShoppingCenterNearbySerializer(centers, many=True)
+    return Response({
+        'count': len(centers),
+        'truncated': len(centers) == NEARBY_BATCH_MAX_RESULTS,
+        'results': serializer.data
+    })
+
+
 # =============================================================================
 # IMPORT VIEWS (Sprint 2 preparation)
 # =============================================================================
@@ -504,6 +504,11 @@ class GeocodingService:
                 if hasattr(shopping_center, 'location'):
                     save_fields.append('location')
                 
+                # Remember which address these coordinates belong to
+                if hasattr(shopping_center, 'address_hash'):
+                    shopping_center.address_hash = shopping_center.get_address_hash()
+                    save_fields.append('address_hash')
+                
                 shopping_center.save(update_fields=save_fields)
                 
         except Exception as e:
@@ -715,6 +720,32 @@ def geocode_address(address: str) -> Tuple[float, float]:
     return result
 
 
+def geocode_shopping_center_by_id(shopping_center_id: int) -> Optional[GeocodingResult]:
+    """
+    Geocode a stored shopping center by ID.
+    
+    Call it outside the saving transaction, so the Google Maps call
+    happens after that transaction has released its locks.
+    
+    Args:
+        shopping_center_id: ShoppingCenter primary key
+        
+    Returns:
+        GeocodingResult, or None if the center is gone or geocoding is unavailable
+    """
+    from properties.models import ShoppingCenter
+    
+    shopping_center = ShoppingCenter.objects.filter(pk=shopping_center_id).first()
+    if shopping_center is None:
+        return None
+    
+    try:
+        return GeocodingService().geocode_shopping_center(shopping_center)
+    except Exception as e:
+        logger.warning(f"Geocoding failed for shopping center {shopping_center_id}: {str(e)}")
+        return None
+
+
 def is_valid_us_coordinates(latitude: float, longitude: float) -> bool:
     """
     Quick validation for US coordinates.
@@ -852,6 +883,7 @@ __all__ = [
     'GeocodingQuotaStatus',
     'geocode_address_simple',
     'geocode_address',  # Added wrapper function
+    'geocode_shopping_center_by_id',
     'is_valid_us_coordinates',
     'get_geocoding_stats',
     'geocode_all_missing_coordinates'
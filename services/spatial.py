@@ -0,0 +1,289 @@
+"""
+Spatial Helper Services for Shop Window Application.
+
+Pure-Python helpers for spatial prefilters that run before PostGIS:
+- Geohash encoding matching PostGIS ST_GeoHash
+- Choosing a geohash precision whose cells cover a search radius
+- Listing the 3x3 block of cells around a point
+- Web Mercator bounds of XYZ map tiles and lat/lng viewports
+- Web Mercator boxes that contain a search radius
+
+ShoppingCenter.geohash stores ST_GeoHash(location, 9); a radius search
+can match the cells returned by geohash_cells_for_radius() with a B-tree
+prefix scan and leave exact distance checks to PostGIS.
+"""
+
+import math
+from typing import List, Optional
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+# Precision of the stored ShoppingCenter.geohash column
+GEOHASH_MAX_PRECISION = 9
+
+# Radius of the sphere PostGIS measures on with use_spheroid=false
+# (ST_Distance/ST_DWithin(..., false)), in meters
+EARTH_MEAN_RADIUS = 6371008.8
+
+# Meters per degree of latitude (and of longitude at the equator) on that sphere
+METERS_PER_DEGREE = math.radians(EARTH_MEAN_RADIUS)
+
+# Relative slack added to a search radius by the prefilters below, so
+# rounding never drops a point that ST_DWithin would keep
+RADIUS_BOX_MARGIN = 1.01
+
+
+# =============================================================================
+# GEOHASH ENCODING
+# =============================================================================
+
+def geohash_encode(lat: float, lng: float, precision: int = GEOHASH_MAX_PRECISION) -> str:
+    """
+    Encode a point as a geohash.
+
+    Args:
+        lat: Latitude in degrees (-90 to 90)
+        lng: Longitude in degrees (-180 to 180)
+        precision: Number of geohash characters
+
+    Returns:
+        Geohash string of the given length
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # Geohash interleaves bits starting with longitude
+
+    while len(chars) < precision:
+        value, value_range = (lng, lng_range) if even else (lat, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            value_range[0] = mid
+        else:
+            bits <<= 1
+            value_range[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(chars)
+
+
+def geohash_cell_size(precision: int) -> tuple:
+    """
+    Size of a geohash cell in degrees.
+
+    Returns:
+        (height in degrees latitude, width in degrees longitude)
+    """
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+# =============================================================================
+# RADIUS PREFILTER
+# =============================================================================
+
+def geohash_precision_for_radius(lat: float, radius_m: float) -> Optional[int]:
+    """
+    Finest geohash precision whose cells are at least radius_m on each side.
+
+    With cells that large, every point within radius_m of the search point
+    lies in the search point's cell or one of its 8 neighbours. Cell widths
+    are measured at the poleward edge of the circle, where they are
+    narrowest, and must exceed the radius by RADIUS_BOX_MARGIN.
+
+    Args:
+        lat: Latitude of the search point (longitude cells shrink with cos(lat))
+        radius_m: Search radius in meters
+
+    Returns:
+        Precision (1-9), or None if even precision 1 cells are too small
+        or the circle reaches a pole
+    """
+    required_m = radius_m * RADIUS_BOX_MARGIN
+    poleward_lat = abs(lat) + math.degrees(radius_m / EARTH_MEAN_RADIUS)
+    if poleward_lat >= 90.0:
+        return None
+    cos_lat = math.cos(math.radians(poleward_lat))
+    for precision in range(GEOHASH_MAX_PRECISION, 0, -1):
+        height, width = geohash_cell_size(precision)
+        height_m = height * METERS_PER_DEGREE
+        width_m = width * METERS_PER_DEGREE * cos_lat
+        if min(height_m, width_m) >= required_m:
+            return precision
+    return None
+
+
+def geohash_cells_for_radius(lat: float, lng: float, radius_m: float) -> Optional[List[str]]:
+    """
+    Geohash cells that together cover a circle around a point.
+
+    Args:
+        lat: Latitude of the search point
+        lng: Longitude of the search point
+        radius_m: Search radius in meters
+
+    Returns:
+        The point's cell and its neighbours (up to 9 distinct prefixes), or
+        None when no geohash precision covers the radius (e.g. near the poles)
+    """
+    precision = geohash_precision_for_radius(lat, radius_m)
+    if precision is None:
+        return None
+
+    height, width = geohash_cell_size(precision)
+    cells = set()
+    for dlat in (-height, 0.0, height):
+        neighbour_lat = lat + dlat
+        if not -90.0 <= neighbour_lat <= 90.0:
+            continue  # No cells beyond the poles
+        for dlng in (-width, 0.0, width):
+            # Wrap across the antimeridian
+            neighbour_lng = (lng + dlng + 180.0) % 360.0 - 180.0
+            cells.add(geohash_encode(neighbour_lat, neighbour_lng, precision))
+
+    return sorted(cells)
+
+
+# =============================================================================
+# MAP TILES
+# =============================================================================
+
+# Radius of the Web Mercator (EPSG:3857) sphere, in meters
+WEB_MERCATOR_RADIUS = 6378137.0
+
+# Half the width of the Web Mercator (EPSG:3857) world square, in meters
+WEB_MERCATOR_EXTENT = 20037508.342789244
+
+# Latitude at which the Web Mercator square ends (y == WEB_MERCATOR_EXTENT)
+WEB_MERCATOR_MAX_LAT = 85.0511287798066
+
+MAX_TILE_ZOOM = 22
+
+
+def tile_envelope_3857(z: int, x: int, y: int) -> tuple:
+    """
+    Web Mercator bounds of an XYZ (slippy map) tile.
+
+    Args:
+        z: Zoom level (0-22)
+        x: Tile column, 0 at the antimeridian going east
+        y: Tile row, 0 at the top (north)
+
+    Returns:
+        (xmin, ymin, xmax, ymax) in EPSG:3857 meters
+
+    Raises:
+        ValueError: If the tile does not exist at that zoom level
+    """
+    if not 0 <= z <= MAX_TILE_ZOOM:
+        raise ValueError(f"Zoom must be between 0 and {MAX_TILE_ZOOM}")
+    tiles_per_side = 2 ** z
+    if not (0 <= x < tiles_per_side and 0 <= y < tiles_per_side):
+        raise ValueError(f"Tile {z}/{x}/{y} is out of range")
+
+    tile_size = 2 * WEB_MERCATOR_EXTENT / tiles_per_side
+    xmin = -WEB_MERCATOR_EXTENT + x * tile_size
+    ymax = WEB_MERCATOR_EXTENT - y * tile_size
+    return xmin, ymax - tile_size, xmin + tile_size, ymax
+
+
+def lat_lng_to_3857(lat: float, lng: float) -> tuple:
+    """
+    Project a point to Web Mercator (same formula as ST_Transform(..., 3857)).
+
+    Returns:
+        (x, y) in EPSG:3857 meters
+    """
+    lat = max(-WEB_MERCATOR_MAX_LAT, min(WEB_MERCATOR_MAX_LAT, lat))
+    return (
+        WEB_MERCATOR_RADIUS * math.radians(lng),
+        WEB_MERCATOR_RADIUS * math.log(math.tan(math.pi / 4 + math.radians(lat) / 2)),
+    )
+
+
+def bbox_envelopes_3857(sw_lat: float, sw_lng: float, ne_lat: float, ne_lng: float) -> List[tuple]:
+    """
+    Web Mercator envelopes of a latitude/longitude box, e.g. a map viewport.
+
+    The envelope edges stay on constant latitude and longitude, as on the
+    map (a geography polygon's edges would be great circles instead).
+    Latitudes are clamped to the Mercator square; a box whose west edge is
+    east of its east edge crosses the antimeridian and is split in two.
+
+    Returns:
+        List of (xmin, ymin, xmax, ymax) in EPSG:3857 meters
+
+    Raises:
+        ValueError: If a coordinate is out of range or sw_lat > ne_lat
+    """
+    if not all(math.isfinite(value) for value in (sw_lat, sw_lng, ne_lat, ne_lng)):
+        raise ValueError("Bounds must be finite numbers")
+    if not (-90.0 <= sw_lat <= ne_lat <= 90.0):
+        raise ValueError("Latitudes must be between -90 and 90, south to north")
+    if not (-180.0 <= sw_lng <= 180.0 and -180.0 <= ne_lng <= 180.0):
+        raise ValueError("Longitudes must be between -180 and 180")
+
+    spans = [(sw_lng, ne_lng)] if sw_lng <= ne_lng else [(sw_lng, 180.0), (-180.0, ne_lng)]
+    envelopes = []
+    for west, east in spans:
+        xmin, ymin = lat_lng_to_3857(sw_lat, west)
+        xmax, ymax = lat_lng_to_3857(ne_lat, east)
+        envelopes.append((xmin, ymin, xmax, ymax))
+    return envelopes
+
+
+# =============================================================================
+# MERCATOR PREFILTER
+# =============================================================================
+
+def mercator_bbox_for_radius(lat: float, lng: float, radius_m: float) -> Optional[tuple]:
+    """
+    Web Mercator box containing every point within radius_m of a point.
+
+    The circle is bounded in latitude/longitude on the sphere PostGIS uses
+    for ST_DWithin(..., false) and both corners are projected, so the box
+    accounts for the Mercator scale growing towards the poleward edge.
+
+    Args:
+        lat: Latitude of the search point
+        lng: Longitude of the search point
+        radius_m: Search radius in meters
+
+    Returns:
+        (xmin, ymin, xmax, ymax) in EPSG:3857 meters, or None when no single
+        box works: the circle contains a pole or crosses the antimeridian
+    """
+    angular_radius = radius_m * RADIUS_BOX_MARGIN / EARTH_MEAN_RADIUS
+    phi = math.radians(lat)
+    phi_min = phi - angular_radius
+    phi_max = phi + angular_radius
+    if phi_min <= -math.pi / 2 or phi_max >= math.pi / 2:
+        return None
+
+    # Longitude half-width of a spherical cap that doesn't contain a pole
+    half_width = math.asin(math.sin(angular_radius) / math.cos(phi))
+    lambda_min = math.radians(lng) - half_width
+    lambda_max = math.radians(lng) + half_width
+    if lambda_min < -math.pi or lambda_max > math.pi:
+        return None
+
+    def mercator_y(latitude):
+        return WEB_MERCATOR_RADIUS * math.log(math.tan(math.pi / 4 + latitude / 2))
+
+    return (
+        WEB_MERCATOR_RADIUS * lambda_min,
+        mercator_y(phi_min),
+        WEB_MERCATOR_RADIUS * lambda_max,
+        mercator_y(phi_max),
+    )
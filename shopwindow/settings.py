@@ -70,6 +70,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.gzip.GZipMiddleware',  # Compress API responses (honors Accept-Encoding)
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Static files for production
     'corsheaders.middleware.CorsMiddleware',  # CORS for frontend integration
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -119,10 +120,49 @@ DATABASES['default']['ENGINE'] = 'django.contrib.gis.db.backends.postgis'
 
 # Database connection settings for production reliability
 DATABASES['default']['CONN_MAX_AGE'] = 600  # Connection pooling
+# Check persistent connections before reuse instead of failing the request
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
 DATABASES['default']['OPTIONS'] = {
     'sslmode': 'require',
 }
 
+# Behind pgbouncer in transaction-pool mode the pooler keeps the server
+# connections: close Django's per request and avoid server-side cursors,
+# which don't survive across pooled transactions
+if os.environ.get('DB_POOL_MODE', '').lower() == 'pgbouncer':
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
+# Server-side parameter binding lets psycopg prepare statements that are
+# executed repeatedly on a connection (e.g. the nearby_properties query,
+# whose SQL text is identical on every call). Requires direct connections
+# or pgbouncer >= 1.21 with max_prepared_statements.
+if os.environ.get('DB_SERVER_SIDE_BINDING', 'False').lower() == 'true':
+    DATABASES['default']['OPTIONS']['server_side_binding'] = True
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+# Cached statistics and nearby-search results are invalidated explicitly, so
+# the cache must be shared by every gunicorn worker and instance; the default
+# per-process LocMemCache would keep serving stale entries on other workers.
+# The database cache needs no extra service (`manage.py createcachetable`).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        'TIMEOUT': int(os.environ.get('CACHE_TTL', 900)),
+        # Nearby searches are keyed per rounded point and radius, so the
+        # default 300 entries would be culled on almost every set. Size the
+        # table for the key space and drop a quarter of it when it is full.
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 50000)),
+            'CULL_FREQUENCY': 4,
+        },
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -382,4 +422,9 @@ SPATIAL_SETTINGS = {
     'DEFAULT_SRID': 4326,  # WGS84 coordinate system
     'DISTANCE_UNITS': 'km',  # Kilometers for distance calculations
     'DEFAULT_BUFFER_SIZE': 5,  # 5km default buffer for spatial queries
+    # Index type(s) on ShoppingCenter.location: 'gist', 'spgist' or 'both'.
+    # The GiST index always exists (KNN ordering needs it); 'spgist'/'both'
+    # add an SP-GiST one when migrating, so nearby queries can be compared
+    # with EXPLAIN (ANALYZE, BUFFERS)
+    'LOCATION_INDEX': os.environ.get('SPATIAL_LOCATION_INDEX', 'gist').lower(),
 }